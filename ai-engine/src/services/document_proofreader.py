@@ -3,15 +3,37 @@
 申請書文章の品質向上・誤字脱字チェック・文体統一・内容最適化
 """
 
-from typing import Dict, List, Optional, Any, Tuple, Union
+from typing import Dict, List, Optional, Any, Tuple, Union, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import cached_property, lru_cache
 import asyncio
+import bisect
+import copy
+import hashlib
 import logging
 import re
 import json
-from collections import defaultdict, Counter
+import threading
+from itertools import accumulate, chain
+from collections import defaultdict, Counter, OrderedDict, deque
+
+import numpy as np
+
+# 線形時間の正規表現エンジン（任意）
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# 形態素解析による用語抽出（任意）
+try:
+    import fugashi
+    FUGASHI_AVAILABLE = True
+except ImportError:
+    FUGASHI_AVAILABLE = False
 
 from .enhanced_ai_service import EnhancedAIService, AIProvider
 from .application_writer import ApplicationSection, ApplicationDocument, GeneratedSection
@@ -20,6 +42,237 @@ from ..prompts.prompt_manager import PromptManager
 
 logger = logging.getLogger(__name__)
 
+# AI校正結果キャッシュの最大保持件数
+AI_PROOFREADING_CACHE_SIZE = 1024
+
+# 文体分析結果キャッシュの最大保持件数
+TEXT_STYLE_CACHE_SIZE = 512
+
+# 可読性統計をnumpyで一括算出する最小文字数（短文では配列化のコストが上回る）
+READABILITY_VECTORIZE_MIN_LENGTH = 2000
+
+# セクション別校正の同時実行数上限（AIプロバイダーへの同時リクエストを抑制）
+SECTION_PROOFREADING_CONCURRENCY = 8
+
+
+def _compile_scan_pattern(pattern: str):
+    """
+    固定語句・文字クラスのみのスキャンパターンをコンパイル
+    
+    RE2が利用可能な場合はバックトラックしないRE2でコンパイルする。
+    RE2の \\b・\\w はASCII基準で日本語に一致しないため、それらを含むパターンには使用しないこと。
+    """
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            pass
+    return re.compile(pattern)
+
+
+# 校正用パターン（モジュール読み込み時に一度だけコンパイル）
+# 文末記号と受動態表現（明瞭性チェックで1回の走査により両方を検出）
+_CLARITY_RE = _compile_scan_pattern(r'(?P<end>[。！？])|(?P<passive>られる|れる)')
+
+# 丁寧語不足（常体）パターン
+_CASUAL_PATTERNS = [
+    _compile_scan_pattern(r'する\.'),
+    _compile_scan_pattern(r'だ\.'),
+    _compile_scan_pattern(r'である\.')
+]
+
+# 口語表現 → フォーマル表現
+_INFORMAL_PATTERNS = [
+    (_compile_scan_pattern(r'ちょっと'), 'やや'),
+    (_compile_scan_pattern(r'けっこう'), 'かなり'),
+    (_compile_scan_pattern(r'すごく'), '非常に'),
+    (_compile_scan_pattern(r'たくさん'), '多数'),
+    (_compile_scan_pattern(r'いっぱい'), '多数')
+]
+
+# 冗長表現 → 簡潔な表現
+_REDUNDANT_PATTERNS = [
+    (_compile_scan_pattern(r'まず最初に'), 'まず'),
+    (_compile_scan_pattern(r'一番最初'), '最初'),
+    (_compile_scan_pattern(r'後で後から'), '後で'),
+    (_compile_scan_pattern(r'将来的には'), '将来は'),
+    (_compile_scan_pattern(r'現在のところ'), '現在'),
+    (_compile_scan_pattern(r'今現在'), '現在')
+]
+
+# 敬語表現の推奨
+_FORMAL_IMPROVEMENTS = {
+    'します': 'いたします',
+    '行います': '行わせていただきます',
+    '考えます': '考えております',
+    '思います': '考えております'
+}
+_FORMAL_RE = _compile_scan_pattern('|'.join(_FORMAL_IMPROVEMENTS))
+
+# 既に敬語表現になっていることを示す語句
+_HONORIFIC_CONTEXT_RE = _compile_scan_pattern(r'いたし|させていただ|ております')
+_HONORIFIC_CONTEXT_WINDOW = 10
+
+# 可読性・文体・一貫性分析用パターン
+# （\w・\d はUnicode文字を前提とするため標準 re を使用）
+_SENTENCE_END_RE = _compile_scan_pattern(r'[。！？]')
+_WORD_RE = re.compile(r'\w+')
+_KANJI2_RE = _compile_scan_pattern('[\u4e00-\u9faf]{2,}')
+_KANJI3_RE = _compile_scan_pattern('[\u4e00-\u9faf]{3,}')
+_HONORIFIC_WORDS = ('です', 'ます', 'いたし', 'ござい')
+_PASSIVE_RE = _compile_scan_pattern(r'れる|られる')
+
+# 可読性分析の文字コード範囲（numpy一括算出用）
+_SENTENCE_END_CODES = np.array([ord(c) for c in '。！？'], dtype=np.uint32)
+_KANJI_CODE_RANGE = (0x4e00, 0x9faf)
+
+# 数値表記パターン（アラビア数字・漢数字を1回の走査で検出）
+# パーセンテージ・通貨はアラビア数字に接尾辞が続く形のため、接尾辞グループで判別する
+_NUMBER_RE = re.compile(r'(?P<arabic>\d+)(?P<suffix>[%円])?|(?P<kanji>[一二三四五六七八九十百千万億]+)')
+_NUMBER_SUFFIX_TYPES = {"%": "percentage", "円": "currency"}
+_NUMBER_PATTERN_TYPES = ("arabic", "kanji", "percentage", "currency")
+
+# 表記ゆれ検出用の類似語グループ（例）
+_SIMILAR_TERM_GROUPS = [
+    ["実施", "実行", "遂行"],
+    ["効果", "効能", "成果"],
+    ["検討", "検証", "確認"]
+]
+
+# 類似語グループに含まれる語のみを単語単位で検出
+_SIMILAR_TERM_RE = re.compile(
+    r'\b(?:' + '|'.join(word for group in _SIMILAR_TERM_GROUPS for word in group) + r')\b'
+)
+
+
+def _compile_word_alternation(words: List[str]) -> Optional[re.Pattern]:
+    """
+    語句リストを名前付きグループの選択パターンに統合
+    
+    各語句は w0, w1, ... のグループに対応し、m.lastgroup から
+    どの語句に一致したかを判別できる（語句数によらず1回の走査で済む）
+    """
+    if not words:
+        return None
+    return re.compile('|'.join(
+        rf'(?P<w{i}>\b{re.escape(word)}\b)' for i, word in enumerate(words)
+    ))
+
+
+def _compile_phrase_alternation(words: Iterable[str]) -> Optional[re.Pattern]:
+    """
+    語句集合を単一の選択パターンに統合（長い語句を優先）
+    
+    一致した語句は m.group(0) で得られるため、辞書引きで置換先を決定できる
+    """
+    words = sorted(words, key=len, reverse=True)
+    if not words:
+        return None
+    return re.compile(r'\b(?:' + '|'.join(map(re.escape, words)) + r')\b')
+
+
+def _compile_terminology_pattern(terms: List[Tuple[str, str]]) -> Optional[re.Pattern]:
+    """
+    技術用語の正式表記・省略表記を1つの選択パターンに統合
+    
+    正式表記は l0, l1, ...、省略表記は s0, s1, ... のグループに対応する。
+    正式表記を先に並べることで「人工知能（AI）」内の「AI」は省略表記として検出されない。
+    """
+    if not terms:
+        return None
+    long_forms = [
+        rf'(?P<l{i}>{re.escape(preferred_term)})'
+        for i, (_, preferred_term) in enumerate(terms)
+    ]
+    short_forms = [
+        rf'(?P<s{i}>\b{re.escape(term)}\b)'
+        for i, (term, _) in enumerate(terms)
+    ]
+    return re.compile('|'.join(long_forms + short_forms))
+
+
+def _utf8_offsets(text: str) -> List[int]:
+    """文字位置 → UTF-8バイト位置の対応表（要素数は len(text) + 1）"""
+    return list(accumulate(
+        (1 if code < 0x80 else 2 if code < 0x800 else 3 if code < 0x10000 else 4
+         for code in map(ord, text)),
+        initial=0
+    ))
+
+
+def _count_matches(pattern, text: str) -> int:
+    """一致件数を計数（一致文字列のリストを生成しない）"""
+    return sum(1 for _ in pattern.finditer(text))
+
+
+def _vectorized_readability_counts(text: str) -> Tuple[int, int]:
+    """
+    文数・難読語数（漢字3文字以上の連続）をnumpyで一括算出
+    
+    文字コード配列に対する1回のマスク演算で、文末記号と漢字連続区間を同時に求める
+    """
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+    sentences = int(np.isin(codes, _SENTENCE_END_CODES).sum()) + 1
+    
+    kanji_mask = ((codes >= _KANJI_CODE_RANGE[0]) & (codes <= _KANJI_CODE_RANGE[1])).astype(np.int8)
+    edges = np.flatnonzero(np.diff(kanji_mask, prepend=0, append=0))
+    run_lengths = edges[1::2] - edges[::2]
+    difficult_words = int((run_lengths >= 3).sum())
+    
+    return sentences, difficult_words
+
+
+def _value_range(values: Iterable[float]) -> float:
+    """最大値と最小値の差を1回の走査で算出（空の場合は0）"""
+    lowest = highest = None
+    for value in values:
+        if lowest is None:
+            lowest = highest = value
+        elif value < lowest:
+            lowest = value
+        elif value > highest:
+            highest = value
+    return highest - lowest if lowest is not None else 0
+
+
+@lru_cache(maxsize=None)
+def _min_common_chars(length: int) -> int:
+    """類似用語判定（一致率 > 0.7）を満たす最小一致文字数"""
+    return next(common for common in range(length + 1) if common / length > 0.7)
+
+
+def _matched_word_index(match: re.Match) -> int:
+    """_compile_word_alternation で構築したパターンの一致語句インデックス"""
+    return int(match.lastgroup[1:])
+
+
+# AI応答中のMarkdownコードブロック（```json ... ```）
+_AI_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.S)
+
+
+def _parse_ai_json(content: str) -> Any:
+    """
+    AI応答からのJSONオブジェクト抽出
+    
+    応答全体、コードブロック内、最初の { から最後の } までの順に試し、
+    いずれもパースできなければNoneを返す
+    """
+    candidates = [content]
+    fence = _AI_JSON_FENCE_RE.search(content)
+    if fence:
+        candidates.append(fence.group(1))
+    start = content.find('{')
+    end = content.rfind('}')
+    if 0 <= start < end:
+        candidates.append(content[start:end + 1])
+    
+    for candidate in candidates:
+        try:
+            return json.loads(candidate)
+        except json.JSONDecodeError:
+            continue
+    return None
+
 
 class IssueType(Enum):
     """校正問題タイプ"""
@@ -33,6 +286,10 @@ class IssueType(Enum):
     COHERENCE = "coherence"               # 一貫性
     FORMAL_LANGUAGE = "formal_language"   # 敬語・丁寧語
     TECHNICAL_ACCURACY = "technical_accuracy"  # 技術的正確性
+    
+    # 集計用辞書のキーとして多用するため、名前文字列ではなく同一性でハッシュする
+    # （メンバーはシングルトンで等価判定も同一性のため、結果は変わらない）
+    __hash__ = object.__hash__
 
 
 class Severity(Enum):
@@ -42,9 +299,34 @@ class Severity(Enum):
     MEDIUM = "medium"       # 中
     LOW = "low"            # 低
     SUGGESTION = "suggestion"  # 提案
+    
+    __hash__ = object.__hash__
+
+
+# AI校正結果の問題タイプ・重要度マッピング
+_AI_ISSUE_TYPE_MAP = {
+    "grammar": IssueType.GRAMMAR,
+    "style": IssueType.STYLE_INCONSISTENCY,
+    "clarity": IssueType.CLARITY,
+    "content": IssueType.COHERENCE
+}
 
+_AI_SEVERITY_MAP = {
+    "high": Severity.HIGH,
+    "medium": Severity.MEDIUM,
+    "low": Severity.LOW
+}
 
-@dataclass
+# 一貫性スコアの重要度別減点
+_CONSISTENCY_SEVERITY_PENALTIES = {
+    Severity.CRITICAL: 15,
+    Severity.HIGH: 10,
+    Severity.MEDIUM: 5,
+    Severity.LOW: 2
+}
+
+
+@dataclass(slots=True)
 class ProofreadingIssue:
     """校正問題"""
     issue_id: str
@@ -59,7 +341,7 @@ class ProofreadingIssue:
     context: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass 
+@dataclass(slots=True)
 class ProofreadingResult:
     """校正結果"""
     document_id: str
@@ -76,7 +358,7 @@ class ProofreadingResult:
     generated_at: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class StyleGuide:
     """文体ガイド"""
     tone: str = "formal"                    # formal, casual, technical
@@ -87,21 +369,32 @@ class StyleGuide:
     technical_terms: Dict[str, str] = field(default_factory=dict)
     forbidden_words: List[str] = field(default_factory=list)
     preferred_expressions: Dict[str, str] = field(default_factory=dict)
+    # 語彙パターンのキャッシュ（種別 → (構築元の語彙, コンパイル済みパターン)）
+    _compiled_patterns: Dict[str, Tuple[tuple, Optional[re.Pattern]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
 
 class DocumentProofreader:
     """文章品質向上・校正サービス"""
     
-    def __init__(self):
-        """初期化"""
-        self.ai_service = EnhancedAIService()
-        self.quality_evaluator = QualityEvaluator()
-        self.prompt_manager = PromptManager()
+    def __init__(self, ai_service: Optional[EnhancedAIService] = None):
+        """初期化（ai_service を渡した場合は呼び出し側の接続プールを共有し、クローズも呼び出し側が行う）"""
+        # 依存サービス・校正ルールは初回利用時に生成する（下記 cached_property を参照）
+        self._owns_ai_service = ai_service is None
+        if ai_service is not None:
+            self.ai_service = ai_service
+        
+        # AI校正結果キャッシュ（セクション種別+本文のハッシュ → 問題リスト、LRU）
+        self.ai_proofreading_cache: OrderedDict[str, List[ProofreadingIssue]] = OrderedDict()
+        
+        # 文体分析結果キャッシュ（本文 → 文体特徴、LRU）
+        # 校正処理はワーカースレッドでも実行されるため、参照・更新はロックで保護する
+        self.text_style_cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._text_style_cache_lock = threading.Lock()
         
-        # 校正ルールとパターン
-        self.grammar_patterns = self._initialize_grammar_patterns()
-        self.spelling_dictionary = self._load_spelling_dictionary()
-        self.terminology_map = self._load_terminology_map()
+        # 形態素解析器はスレッド間で共有できないため、解析時に排他制御する
+        self._tagger_lock = threading.Lock()
         
         # デフォルト文体ガイド
         self.default_style_guide = StyleGuide(
@@ -124,6 +417,68 @@ class DocumentProofreader:
             }
         )
 
+    async def aclose(self):
+        """自身で生成したAIサービスの接続プールを閉じる（未生成の場合は何もしない）"""
+        if self._owns_ai_service and "ai_service" in self.__dict__:
+            await self.ai_service.aclose()
+
+    # 依存サービス・校正ルール（遅延初期化）
+
+    @cached_property
+    def ai_service(self) -> EnhancedAIService:
+        """AIサービス"""
+        return EnhancedAIService()
+
+    @cached_property
+    def quality_evaluator(self) -> QualityEvaluator:
+        """品質評価サービス"""
+        return QualityEvaluator()
+
+    @cached_property
+    def prompt_manager(self) -> PromptManager:
+        """プロンプト管理"""
+        return PromptManager()
+
+    @cached_property
+    def tagger(self) -> Optional["fugashi.Tagger"]:
+        """形態素解析器（fugashi未導入・辞書未設定の場合はNone）"""
+        if not FUGASHI_AVAILABLE:
+            return None
+        try:
+            return fugashi.Tagger()
+        except Exception as e:
+            logger.warning(f"形態素解析器初期化失敗、正規表現による用語抽出を使用します: {str(e)}")
+            return None
+
+    @cached_property
+    def grammar_patterns(self) -> List[Tuple[re.Pattern, Dict[str, Any]]]:
+        """文法パターン"""
+        return self._initialize_grammar_patterns()
+
+    @cached_property
+    def spelling_dictionary(self) -> Dict[str, Dict[str, str]]:
+        """誤字脱字辞書"""
+        return self._load_spelling_dictionary()
+
+    @cached_property
+    def terminology_map(self) -> Dict[str, str]:
+        """用語マップ"""
+        return self._load_terminology_map()
+
+    @cached_property
+    def common_mistakes(self) -> Dict[str, str]:
+        """誤記 → 正記（誤記と正記が同じ項目は指摘不要のため除外）"""
+        return {
+            wrong: correct
+            for wrong, correct in self.spelling_dictionary.get("common_mistakes", {}).items()
+            if wrong != correct
+        }
+
+    @cached_property
+    def _spelling_pattern(self) -> Optional[re.Pattern]:
+        """誤字脱字スキャンパターン"""
+        return self._build_spelling_pattern()
+
     async def proofread_document(
         self,
         document: ApplicationDocument,
@@ -151,19 +506,37 @@ class DocumentProofreader:
             
             logger.info(f"文書校正開始: {document.document_id}")
             
-            # 全体的な品質評価
-            overall_quality = await self._evaluate_overall_quality(document)
+            section_items = list(document.sections.items())
+            
+            # AI校正は全セクション分を1回のリクエストにまとめて実行
+            ai_results = await self._ai_batch_proofread({
+                section: generated_section.content
+                for section, generated_section in section_items
+            })
+            
+            # セクション別校正は同時実行数を制限して並行実行
+            semaphore = asyncio.Semaphore(SECTION_PROOFREADING_CONCURRENCY)
+            
+            async def proofread_section_bounded(section, generated_section):
+                async with semaphore:
+                    return await self._proofread_section(
+                        section, generated_section, style_guide, focus_areas,
+                        ai_results.get(section)
+                    )
+            
+            # 全体品質評価・セクション別校正・文書間一貫性チェックは互いに独立しているため並行実行
+            overall_quality, section_results, consistency_issues = await asyncio.gather(
+                self._evaluate_overall_quality(document),
+                asyncio.gather(*[
+                    proofread_section_bounded(section, generated_section)
+                    for section, generated_section in section_items
+                ]),
+                self._check_document_consistency(document, style_guide)
+            )
             
-            # セクション別校正
-            all_issues = []
             improved_content = {}
             
-            for section, generated_section in document.sections.items():
-                section_issues = await self._proofread_section(
-                    section, generated_section, style_guide, focus_areas
-                )
-                all_issues.extend(section_issues)
-                
+            for (section, generated_section), section_issues in zip(section_items, section_results):
                 # 自動修正適用
                 if auto_fix:
                     improved_text = await self._apply_auto_fixes(
@@ -173,18 +546,12 @@ class DocumentProofreader:
                 else:
                     improved_content[section] = generated_section.content
             
-            # 文書間一貫性チェック
-            consistency_issues = await self._check_document_consistency(
-                document, style_guide
-            )
-            all_issues.extend(consistency_issues)
-            
-            # 結果集計
+            # 結果集計（セクション別・文書間の問題は中間リストを作らず集計時に1回だけ走査）
             processing_time = (datetime.now() - start_time).total_seconds()
             
             result = await self._compile_proofreading_result(
                 document.document_id,
-                all_issues,
+                chain.from_iterable((*section_results, consistency_issues)),
                 improved_content,
                 overall_quality,
                 processing_time
@@ -202,7 +569,8 @@ class DocumentProofreader:
         text: str,
         section_type: ApplicationSection,
         context: Dict[str, Any] = None,
-        style_guide: Optional[StyleGuide] = None
+        style_guide: Optional[StyleGuide] = None,
+        ai_issues: Optional[List[ProofreadingIssue]] = None
     ) -> List[ProofreadingIssue]:
         """
         テキスト校正
@@ -212,6 +580,7 @@ class DocumentProofreader:
             section_type: セクションタイプ
             context: コンテキスト情報
             style_guide: 文体ガイド
+            ai_issues: 一括AI校正で取得済みの問題（指定時はAI校正リクエストを省略）
             
         Returns:
             List[ProofreadingIssue]: 検出された問題リスト
@@ -220,21 +589,32 @@ class DocumentProofreader:
             if style_guide is None:
                 style_guide = self.default_style_guide
             
-            issues = []
-            
-            # 基本校正チェック
-            issues.extend(await self._check_grammar(text, section_type))
-            issues.extend(await self._check_spelling(text, section_type))
-            issues.extend(await self._check_style_consistency(text, style_guide))
-            issues.extend(await self._check_terminology(text, style_guide))
-            issues.extend(await self._check_tone(text, style_guide))
-            issues.extend(await self._check_clarity(text, section_type))
-            issues.extend(await self._check_redundancy(text))
-            issues.extend(await self._check_formal_language(text, style_guide))
+            # ルールベースの基本校正チェック（CPU処理）はワーカースレッドで実行し、
+            # イベントループはAI校正の通信待ちに専念させる
+            checks = [
+                asyncio.to_thread(self._run_rule_checks, text, section_type, style_guide)
+            ]
+            # AIベース校正（一括AI校正済みの場合は文法観点も含まれるため省略）
+            if ai_issues is None:
+                checks.append(self._ai_grammar_check(text, section_type))
+                checks.append(self._ai_based_proofreading(text, section_type, context))
             
-            # AIベース校正
-            ai_issues = await self._ai_based_proofreading(text, section_type, context)
-            issues.extend(ai_issues)
+            issues = []
+            for check_issues in await asyncio.gather(*checks):
+                issues.extend(check_issues)
+            
+            if ai_issues is not None:
+                issues.extend(ai_issues)
+            
+            # エディタ連携用にUTF-8バイト位置を付与（対応表はテキストごとに1回だけ作成）
+            byte_offsets = None
+            for issue in issues:
+                location = issue.location
+                if "start" in location and "end" in location:
+                    if byte_offsets is None:
+                        byte_offsets = _utf8_offsets(text)
+                    location["byte_start"] = byte_offsets[location["start"]]
+                    location["byte_end"] = byte_offsets[location["end"]]
             
             return issues
             
@@ -259,35 +639,66 @@ class DocumentProofreader:
         Returns:
             Dict: 改善結果
         """
+        results = await self.improve_readability_batch([text], target_audience, complexity_level)
+        return results[0]
+
+    async def improve_readability_batch(
+        self,
+        texts: List[str],
+        target_audience: str = "general",
+        complexity_level: str = "medium"
+    ) -> List[Dict[str, Any]]:
+        """
+        可読性一括向上（改善版テキストのAI生成を並行実行）
+        
+        Args:
+            texts: 対象テキストリスト
+            target_audience: 対象読者層
+            complexity_level: 複雑度レベル
+            
+        Returns:
+            List[Dict]: 改善結果（入力順）
+        """
         try:
             # 現在の可読性分析
-            current_readability = await self._analyze_readability(text)
+            current_readabilities = await asyncio.gather(*[
+                asyncio.to_thread(self._analyze_readability, text) for text in texts
+            ])
             
             # 改善提案生成
-            improvement_suggestions = await self._generate_readability_improvements(
-                text, target_audience, complexity_level, current_readability
-            )
+            improvement_suggestions = [
+                await self._generate_readability_improvements(
+                    text, target_audience, complexity_level, current_readability
+                )
+                for text, current_readability in zip(texts, current_readabilities)
+            ]
             
-            # 改善版テキスト生成
-            improved_text = await self._generate_improved_text(
-                text, improvement_suggestions
+            # 改善版テキスト生成（全テキスト分を並行リクエスト）
+            improved_texts = await self._generate_improved_texts_batch(
+                list(zip(texts, improvement_suggestions))
             )
             
-            # 改善後可読性評価
-            improved_readability = await self._analyze_readability(improved_text)
+            results = []
+            for text, improved_text, current_readability, improvements in zip(
+                texts, improved_texts, current_readabilities, improvement_suggestions
+            ):
+                # 改善後可読性評価
+                improved_readability = await asyncio.to_thread(self._analyze_readability, improved_text)
+                
+                results.append({
+                    "original_text": text,
+                    "improved_text": improved_text,
+                    "original_readability": current_readability,
+                    "improved_readability": improved_readability,
+                    "improvements": improvements,
+                    "improvement_score": improved_readability["score"] - current_readability["score"]
+                })
             
-            return {
-                "original_text": text,
-                "improved_text": improved_text,
-                "original_readability": current_readability,
-                "improved_readability": improved_readability,
-                "improvements": improvement_suggestions,
-                "improvement_score": improved_readability["score"] - current_readability["score"]
-            }
+            return results
             
         except Exception as e:
             logger.error(f"可読性向上エラー: {str(e)}")
-            return {"error": str(e)}
+            return [{"error": str(e)} for _ in texts]
 
     async def ensure_document_consistency(
         self,
@@ -308,23 +719,16 @@ class DocumentProofreader:
             if consistency_rules is None:
                 consistency_rules = self._get_default_consistency_rules()
             
+            # 用語統一・数値表記統一・文体統一・構成一貫性チェックは互いに独立しているため並行実行
+            # （正規表現走査が主体のCPU処理はワーカースレッドで実行）
             consistency_issues = []
-            
-            # 用語統一チェック
-            terminology_issues = await self._check_terminology_consistency(document)
-            consistency_issues.extend(terminology_issues)
-            
-            # 数値表記統一チェック
-            numeric_issues = await self._check_numeric_consistency(document)
-            consistency_issues.extend(numeric_issues)
-            
-            # 文体統一チェック
-            style_issues = await self._check_style_consistency_across_sections(document)
-            consistency_issues.extend(style_issues)
-            
-            # 構成一貫性チェック
-            structure_issues = await self._check_structural_consistency(document)
-            consistency_issues.extend(structure_issues)
+            for check_issues in await asyncio.gather(
+                asyncio.to_thread(self._check_terminology_consistency, document),
+                asyncio.to_thread(self._check_numeric_consistency, document),
+                asyncio.to_thread(self._check_style_consistency_across_sections, document),
+                self._check_structural_consistency(document)
+            ):
+                consistency_issues.extend(check_issues)
             
             # 一貫性スコア計算
             consistency_score = await self._calculate_consistency_score(
@@ -346,7 +750,25 @@ class DocumentProofreader:
 
     # 基本校正チェック関数
 
-    async def _check_grammar(
+    def _run_rule_checks(
+        self,
+        text: str,
+        section_type: ApplicationSection,
+        style_guide: StyleGuide
+    ) -> List[ProofreadingIssue]:
+        """ルールベース校正チェック一括実行（同期処理・ワーカースレッドから呼び出し）"""
+        issues = []
+        issues.extend(self._check_grammar(text, section_type))
+        issues.extend(self._check_spelling(text, section_type))
+        issues.extend(self._check_style_consistency(text, style_guide))
+        issues.extend(self._check_terminology(text, style_guide))
+        issues.extend(self._check_tone(text, style_guide))
+        issues.extend(self._check_clarity(text, section_type))
+        issues.extend(self._check_redundancy(text))
+        issues.extend(self._check_formal_language(text, style_guide))
+        return issues
+
+    def _check_grammar(
         self,
         text: str,
         section_type: ApplicationSection
@@ -355,9 +777,8 @@ class DocumentProofreader:
         issues = []
         
         # ルールベース文法チェック
-        for pattern, rule in self.grammar_patterns.items():
-            matches = re.finditer(pattern, text)
-            for match in matches:
+        for pattern, rule in self.grammar_patterns:
+            for match in pattern.finditer(text):
                 issue = ProofreadingIssue(
                     issue_id=f"grammar_{match.start()}_{match.end()}",
                     issue_type=IssueType.GRAMMAR,
@@ -374,13 +795,9 @@ class DocumentProofreader:
                 )
                 issues.append(issue)
         
-        # AIベース文法チェック
-        ai_grammar_issues = await self._ai_grammar_check(text, section_type)
-        issues.extend(ai_grammar_issues)
-        
         return issues
 
-    async def _check_spelling(
+    def _check_spelling(
         self,
         text: str,
         section_type: ApplicationSection
@@ -388,36 +805,32 @@ class DocumentProofreader:
         """誤字脱字チェック"""
         issues = []
         
-        # 辞書ベースチェック
-        words = re.findall(r'\w+', text)
-        for i, word in enumerate(words):
-            if word in self.spelling_dictionary.get("common_mistakes", {}):
-                correct_word = self.spelling_dictionary["common_mistakes"][word]
-                
-                # テキスト内の位置を特定
-                pattern = rf'\b{re.escape(word)}\b'
-                matches = list(re.finditer(pattern, text))
-                
-                for match in matches:
-                    issue = ProofreadingIssue(
-                        issue_id=f"spelling_{match.start()}_{match.end()}",
-                        issue_type=IssueType.SPELLING,
-                        severity=Severity.HIGH,
-                        location={
-                            "start": match.start(),
-                            "end": match.end(),
-                            "section": section_type.value
-                        },
-                        original_text=word,
-                        suggested_text=correct_word,
-                        explanation=f"「{word}」は「{correct_word}」の誤記の可能性があります",
-                        auto_fixable=True
-                    )
-                    issues.append(issue)
+        if self._spelling_pattern is None:
+            return issues
+        
+        # 辞書ベースチェック（全誤記語を単一パターンで一括走査）
+        for match in self._spelling_pattern.finditer(text):
+            word = match.group(0)
+            correct_word = self.common_mistakes[word]
+            issue = ProofreadingIssue(
+                issue_id=f"spelling_{match.start()}_{match.end()}",
+                issue_type=IssueType.SPELLING,
+                severity=Severity.HIGH,
+                location={
+                    "start": match.start(),
+                    "end": match.end(),
+                    "section": section_type.value
+                },
+                original_text=word,
+                suggested_text=correct_word,
+                explanation=f"「{word}」は「{correct_word}」の誤記の可能性があります",
+                auto_fixable=True
+            )
+            issues.append(issue)
         
         return issues
 
-    async def _check_style_consistency(
+    def _check_style_consistency(
         self,
         text: str,
         style_guide: StyleGuide
@@ -428,10 +841,8 @@ class DocumentProofreader:
         # 敬語レベルチェック
         if style_guide.honorific_level == "respectful":
             # 丁寧語不足をチェック
-            casual_patterns = [r'する\.', r'だ\.', r'である\.']
-            for pattern in casual_patterns:
-                matches = re.finditer(pattern, text)
-                for match in matches:
+            for pattern in _CASUAL_PATTERNS:
+                for match in pattern.finditer(text):
                     issue = ProofreadingIssue(
                         issue_id=f"style_{match.start()}_{match.end()}",
                         issue_type=IssueType.STYLE_INCONSISTENCY,
@@ -447,11 +858,14 @@ class DocumentProofreader:
                     )
                     issues.append(issue)
         
-        # 禁止語句チェック
-        for forbidden_word in style_guide.forbidden_words:
-            pattern = rf'\b{re.escape(forbidden_word)}\b'
-            matches = re.finditer(pattern, text)
-            for match in matches:
+        # 禁止語句チェック（全禁止語句を1回の走査で検出）
+        forbidden_words = tuple(style_guide.forbidden_words)
+        forbidden_pattern = self._get_style_guide_pattern(
+            style_guide, "forbidden", forbidden_words, _compile_word_alternation
+        )
+        if forbidden_pattern is not None:
+            for match in forbidden_pattern.finditer(text):
+                forbidden_word = forbidden_words[_matched_word_index(match)]
                 issue = ProofreadingIssue(
                     issue_id=f"forbidden_{match.start()}_{match.end()}",
                     issue_type=IssueType.STYLE_INCONSISTENCY,
@@ -469,7 +883,7 @@ class DocumentProofreader:
         
         return issues
 
-    async def _check_terminology(
+    def _check_terminology(
         self,
         text: str,
         style_guide: StyleGuide
@@ -477,12 +891,22 @@ class DocumentProofreader:
         """用語統一チェック"""
         issues = []
         
-        # 技術用語チェック
-        for term, preferred_term in style_guide.technical_terms.items():
-            if term in text and preferred_term not in text:
-                pattern = rf'\b{re.escape(term)}\b'
-                matches = re.finditer(pattern, text)
-                for match in matches:
+        # 技術用語チェック（初出時は正式表記とする）
+        terms = tuple(style_guide.technical_terms.items())
+        term_pattern = self._get_style_guide_pattern(
+            style_guide, "terminology", terms, _compile_terminology_pattern
+        )
+        if term_pattern is not None:
+            first_seen = set()
+            for match in term_pattern.finditer(text):
+                form, index = match.lastgroup[0], int(match.lastgroup[1:])
+                if index in first_seen:
+                    continue
+                first_seen.add(index)
+                
+                # 初出が省略表記の場合のみ指摘
+                if form == "s":
+                    term, preferred_term = terms[index]
                     issue = ProofreadingIssue(
                         issue_id=f"terminology_{match.start()}_{match.end()}",
                         issue_type=IssueType.TERMINOLOGY,
@@ -497,36 +921,43 @@ class DocumentProofreader:
                         auto_fixable=True
                     )
                     issues.append(issue)
+                
+                if len(first_seen) == len(terms):
+                    break
         
         # 表記ゆれチェック
-        terminology_variations = await self._detect_terminology_variations(text)
+        terminology_variations = self._detect_terminology_variations(text)
+        variation_targets = []  # (表記, 推奨表記)
         for variations in terminology_variations:
             if len(variations) > 1:
                 # 最も頻出する表記を推奨
                 most_common = max(variations, key=lambda x: x[1])
                 for term, count in variations:
                     if term != most_common[0]:
-                        pattern = rf'\b{re.escape(term)}\b'
-                        matches = re.finditer(pattern, text)
-                        for match in matches:
-                            issue = ProofreadingIssue(
-                                issue_id=f"variation_{match.start()}_{match.end()}",
-                                issue_type=IssueType.TERMINOLOGY,
-                                severity=Severity.LOW,
-                                location={
-                                    "start": match.start(),
-                                    "end": match.end()
-                                },
-                                original_text=term,
-                                suggested_text=most_common[0],
-                                explanation=f"表記統一のため「{most_common[0]}」に統一することを推奨します",
-                                auto_fixable=True
-                            )
-                            issues.append(issue)
+                        variation_targets.append((term, most_common[0]))
+        
+        variation_pattern = _compile_word_alternation([term for term, _ in variation_targets])
+        if variation_pattern is not None:
+            for match in variation_pattern.finditer(text):
+                term, preferred_term = variation_targets[_matched_word_index(match)]
+                issue = ProofreadingIssue(
+                    issue_id=f"variation_{match.start()}_{match.end()}",
+                    issue_type=IssueType.TERMINOLOGY,
+                    severity=Severity.LOW,
+                    location={
+                        "start": match.start(),
+                        "end": match.end()
+                    },
+                    original_text=term,
+                    suggested_text=preferred_term,
+                    explanation=f"表記統一のため「{preferred_term}」に統一することを推奨します",
+                    auto_fixable=True
+                )
+                issues.append(issue)
         
         return issues
 
-    async def _check_tone(
+    def _check_tone(
         self,
         text: str,
         style_guide: StyleGuide
@@ -536,17 +967,8 @@ class DocumentProofreader:
         
         # フォーマルトーンの場合の口語表現チェック
         if style_guide.tone == "formal":
-            informal_patterns = {
-                r'ちょっと': 'やや',
-                r'けっこう': 'かなり',
-                r'すごく': '非常に',
-                r'たくさん': '多数',
-                r'いっぱい': '多数'
-            }
-            
-            for pattern, suggestion in informal_patterns.items():
-                matches = re.finditer(pattern, text)
-                for match in matches:
+            for pattern, suggestion in _INFORMAL_PATTERNS:
+                for match in pattern.finditer(text):
                     issue = ProofreadingIssue(
                         issue_id=f"tone_{match.start()}_{match.end()}",
                         issue_type=IssueType.TONE,
@@ -564,7 +986,7 @@ class DocumentProofreader:
         
         return issues
 
-    async def _check_clarity(
+    def _check_clarity(
         self,
         text: str,
         section_type: ApplicationSection
@@ -572,29 +994,44 @@ class DocumentProofreader:
         """明瞭性チェック"""
         issues = []
         
-        # 長すぎる文のチェック
-        sentences = re.split(r'[。！？]', text)
-        for i, sentence in enumerate(sentences):
-            if len(sentence.strip()) > 100:  # 100文字以上
+        passive_count = 0
+        total_sentences = 0
+        sentence_index = 0
+        sentence_start = 0
+        
+        # 文の区切りと受動態表現を1回の走査で処理（末尾の文はNoneを番兵として処理）
+        for match in chain(_CLARITY_RE.finditer(text), [None]):
+            if match is not None and match.lastgroup == "passive":
+                passive_count += 1
+                continue
+            
+            sentence_end = match.start() if match is not None else len(text)
+            sentence = text[sentence_start:sentence_end].strip()
+            if sentence:
+                total_sentences += 1
+            
+            # 長すぎる文のチェック
+            if len(sentence) > 100:  # 100文字以上
                 issue = ProofreadingIssue(
-                    issue_id=f"clarity_long_sentence_{i}",
+                    issue_id=f"clarity_long_sentence_{sentence_index}",
                     issue_type=IssueType.CLARITY,
                     severity=Severity.LOW,
                     location={
-                        "sentence_index": i,
+                        "sentence_index": sentence_index,
                         "section": section_type.value
                     },
-                    original_text=sentence.strip(),
+                    original_text=sentence,
                     suggested_text="[文を分割することを検討]",
                     explanation="文が長すぎるため、読みやすさのために分割を検討してください",
                     auto_fixable=False
                 )
                 issues.append(issue)
+            
+            sentence_index += 1
+            if match is not None:
+                sentence_start = match.end()
         
         # 受動態過多チェック
-        passive_count = len(re.findall(r'れる|られる', text))
-        total_sentences = len([s for s in sentences if s.strip()])
-        
         if total_sentences > 0 and passive_count / total_sentences > 0.3:
             issue = ProofreadingIssue(
                 issue_id="clarity_passive_voice",
@@ -610,23 +1047,13 @@ class DocumentProofreader:
         
         return issues
 
-    async def _check_redundancy(self, text: str) -> List[ProofreadingIssue]:
+    def _check_redundancy(self, text: str) -> List[ProofreadingIssue]:
         """冗長性チェック"""
         issues = []
         
         # 重複表現チェック
-        redundant_patterns = {
-            r'まず最初に': 'まず',
-            r'一番最初': '最初',
-            r'後で後から': '後で',
-            r'将来的には': '将来は',
-            r'現在のところ': '現在',
-            r'今現在': '現在'
-        }
-        
-        for pattern, suggestion in redundant_patterns.items():
-            matches = re.finditer(pattern, text)
-            for match in matches:
+        for pattern, suggestion in _REDUNDANT_PATTERNS:
+            for match in pattern.finditer(text):
                 issue = ProofreadingIssue(
                     issue_id=f"redundancy_{match.start()}_{match.end()}",
                     issue_type=IssueType.REDUNDANCY,
@@ -644,7 +1071,7 @@ class DocumentProofreader:
         
         return issues
 
-    async def _check_formal_language(
+    def _check_formal_language(
         self,
         text: str,
         style_guide: StyleGuide
@@ -653,34 +1080,37 @@ class DocumentProofreader:
         issues = []
         
         if style_guide.honorific_level == "respectful":
-            # 敬語表現の推奨
-            improvements = {
-                r'します': 'いたします',
-                r'行います': '行わせていただきます',
-                r'考えます': '考えております',
-                r'思います': '考えております'
-            }
-            
-            for pattern, suggestion in improvements.items():
-                matches = re.finditer(pattern, text)
-                for match in matches:
-                    # 文脈に応じて判断（すでに敬語の場合は除外）
-                    if not any(honor in text[max(0, match.start()-10):match.end()+10] 
-                             for honor in ['いたし', 'させていただ', 'ております']):
-                        issue = ProofreadingIssue(
-                            issue_id=f"formal_{match.start()}_{match.end()}",
-                            issue_type=IssueType.FORMAL_LANGUAGE,
-                            severity=Severity.SUGGESTION,
-                            location={
-                                "start": match.start(),
-                                "end": match.end()
-                            },
-                            original_text=match.group(0),
-                            suggested_text=suggestion,
-                            explanation="より丁寧な表現を使用することを推奨します",
-                            auto_fixable=True
-                        )
-                        issues.append(issue)
+            honorific_spans = None
+            honorific_starts = None
+            
+            # 敬語表現の推奨（全対象表現を1回の走査で検出）
+            for match in _FORMAL_RE.finditer(text):
+                if honorific_spans is None:
+                    honorific_spans = [(m.start(), m.end()) for m in _HONORIFIC_CONTEXT_RE.finditer(text)]
+                    honorific_starts = [start for start, _ in honorific_spans]
+                
+                # 文脈に応じて判断（前後の範囲内に敬語表現が収まっていれば除外）
+                # 敬語語句は互いに重ならないため、範囲内で最初に始まる語句が最も早く終わる
+                window_start = max(0, match.start() - _HONORIFIC_CONTEXT_WINDOW)
+                window_end = match.end() + _HONORIFIC_CONTEXT_WINDOW
+                index = bisect.bisect_left(honorific_starts, window_start)
+                if index < len(honorific_spans) and honorific_spans[index][1] <= window_end:
+                    continue
+                
+                issue = ProofreadingIssue(
+                    issue_id=f"formal_{match.start()}_{match.end()}",
+                    issue_type=IssueType.FORMAL_LANGUAGE,
+                    severity=Severity.SUGGESTION,
+                    location={
+                        "start": match.start(),
+                        "end": match.end()
+                    },
+                    original_text=match.group(0),
+                    suggested_text=_FORMAL_IMPROVEMENTS[match.group(0)],
+                    explanation="より丁寧な表現を使用することを推奨します",
+                    auto_fixable=True
+                )
+                issues.append(issue)
         
         return issues
 
@@ -693,6 +1123,11 @@ class DocumentProofreader:
         context: Optional[Dict[str, Any]] = None
     ) -> List[ProofreadingIssue]:
         """AI支援校正"""
+        cache_key = self._ai_cache_key("single", text, section_type)
+        cached_issues = self._get_cached_ai_issues(cache_key)
+        if cached_issues is not None:
+            return cached_issues
+        
         try:
             # AI校正プロンプト構築
             proofreading_prompt = f"""
@@ -731,36 +1166,10 @@ JSON形式で問題点を報告：
             if ai_response.success and ai_response.content:
                 try:
                     ai_result = json.loads(ai_response.content)
-                    issues = []
-                    
-                    for item in ai_result.get("issues", []):
-                        # AIが検出した問題をProofreadingIssueに変換
-                        issue_type = self._map_ai_issue_type(item.get("type", "grammar"))
-                        severity = self._map_ai_severity(item.get("severity", "medium"))
-                        
-                        # 文章内の位置を特定
-                        original_text = item.get("original", "")
-                        if original_text and original_text in text:
-                            start_pos = text.find(original_text)
-                            end_pos = start_pos + len(original_text)
-                            
-                            issue = ProofreadingIssue(
-                                issue_id=f"ai_{start_pos}_{end_pos}",
-                                issue_type=issue_type,
-                                severity=severity,
-                                location={
-                                    "start": start_pos,
-                                    "end": end_pos,
-                                    "section": section_type.value
-                                },
-                                original_text=original_text,
-                                suggested_text=item.get("suggested", ""),
-                                explanation=item.get("explanation", ""),
-                                confidence=0.8,
-                                auto_fixable=issue_type in [IssueType.GRAMMAR, IssueType.SPELLING]
-                            )
-                            issues.append(issue)
-                    
+                    issues = self._convert_ai_issues(
+                        ai_result.get("issues", []), text, section_type
+                    )
+                    self._store_ai_issues(cache_key, issues)
                     return issues
                 
                 except json.JSONDecodeError:
@@ -773,6 +1182,184 @@ JSON形式で問題点を報告：
             logger.error(f"AI校正エラー: {str(e)}")
             return []
 
+    async def _ai_batch_proofread(
+        self,
+        sections: Dict[ApplicationSection, str]
+    ) -> Dict[ApplicationSection, List[ProofreadingIssue]]:
+        """
+        一括AI校正
+        
+        全セクションを区切り付きで1つのプロンプトにまとめ、AI校正・AI文法チェックを
+        1回のリクエストで実行する。キャッシュ済みのセクションはリクエストに含めない。
+        結果を得られなかったセクションは戻り値に含まれず、個別校正に戻る。
+        """
+        results = {}
+        cache_keys = {}
+        uncached_sections = {}
+        
+        # キャッシュ済みのセクションはリクエスト対象から除外
+        for section, text in sections.items():
+            if not text.strip():
+                continue
+            cache_key = self._ai_cache_key("batch", text, section)
+            cached_issues = self._get_cached_ai_issues(cache_key)
+            if cached_issues is not None:
+                results[section] = cached_issues
+            else:
+                cache_keys[section] = cache_key
+                uncached_sections[section] = text
+        
+        if not uncached_sections:
+            return results
+        
+        try:
+            section_texts = "\n".join(
+                f"=== SECTION: {section.value} ===\n{text}"
+                for section, text in uncached_sections.items()
+            )
+            
+            batch_prompt = f"""
+以下の申請書の各セクションの文章を校正してください。
+各セクションは「=== SECTION: セクション名 ===」で区切られています。
+
+【対象文章】
+{section_texts}
+
+【校正観点】
+1. 文法・語法の正確性（助詞の誤用、語順、修飾関係の曖昧性、呼応の不一致）
+2. 表現の適切性
+3. 論理的な流れ
+4. ビジネス文書としての品質
+
+【出力形式】
+JSON形式でセクションごとに問題点を報告：
+{{
+    "sections": {{
+        "セクション名": {{
+            "issues": [
+                {{
+                    "type": "grammar|style|clarity|content",
+                    "severity": "high|medium|low",
+                    "original": "問題のある箇所",
+                    "suggested": "修正案",
+                    "explanation": "問題の説明"
+                }}
+            ]
+        }}
+    }}
+}}
+            """
+            
+            ai_response = await self.ai_service.generate_text(
+                prompt=batch_prompt,
+                provider=AIProvider.ANTHROPIC,
+                options={"temperature": 0.3}
+            )
+            
+            if not (ai_response.success and ai_response.content):
+                return results
+            
+            # コードブロックや前後の説明文で囲まれた応答からもJSONを取り出す
+            ai_result = _parse_ai_json(ai_response.content)
+            section_results = ai_result.get("sections") if isinstance(ai_result, dict) else None
+            if not isinstance(section_results, dict):
+                logger.warning("一括AI校正結果のJSON解析に失敗")
+                return results
+            
+            for section, text in uncached_sections.items():
+                section_result = section_results.get(section.value, {})
+                items = section_result.get("issues", []) if isinstance(section_result, dict) else None
+                if not isinstance(items, list):
+                    # 形式が不正なセクションは結果に含めず、個別校正に戻す
+                    logger.warning(f"一括AI校正結果の形式が不正: {section.value}")
+                    continue
+                issues = self._convert_ai_issues(
+                    [item for item in items if isinstance(item, dict)], text, section
+                )
+                self._store_ai_issues(cache_keys[section], issues)
+                results[section] = issues
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"一括AI校正エラー: {str(e)}")
+            return results
+
+    def _ai_cache_key(self, kind: str, text: str, section_type: ApplicationSection) -> str:
+        """
+        AI校正キャッシュキー生成（結果種別・セクション種別と本文の内容ハッシュ）
+        
+        一括校正（"batch"）の結果は文法観点を含み、単体校正（"single"）の結果は含まないため、
+        種別ごとに別のエントリとして保持する
+        """
+        content = f"{kind}|{section_type.value}|{text}"
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+    def _get_cached_ai_issues(self, cache_key: str) -> Optional[List[ProofreadingIssue]]:
+        """キャッシュ済みAI校正結果取得"""
+        cached_issues = self.ai_proofreading_cache.get(cache_key)
+        if cached_issues is None:
+            return None
+        
+        self.ai_proofreading_cache.move_to_end(cache_key)
+        # 呼び出し側での変更がキャッシュに波及しないよう複製を返す
+        return copy.deepcopy(cached_issues)
+
+    def _store_ai_issues(self, cache_key: str, issues: List[ProofreadingIssue]) -> None:
+        """AI校正結果をキャッシュに保存"""
+        self.ai_proofreading_cache[cache_key] = copy.deepcopy(issues)
+        self.ai_proofreading_cache.move_to_end(cache_key)
+        
+        while len(self.ai_proofreading_cache) > AI_PROOFREADING_CACHE_SIZE:
+            self.ai_proofreading_cache.popitem(last=False)
+
+    def _convert_ai_issues(
+        self,
+        items: List[Dict[str, Any]],
+        text: str,
+        section_type: ApplicationSection
+    ) -> List[ProofreadingIssue]:
+        """AIが検出した問題をProofreadingIssueに変換"""
+        issues = []
+        
+        # 指摘箇所の出現位置を一括で索引化
+        fragments = {item.get("original", "") for item in items}
+        fragments.discard("")
+        positions = self._locate_fragments(text, fragments)
+        first_positions = {
+            fragment: starts[0] for fragment, starts in positions.items() if starts
+        }
+        
+        for item in items:
+            issue_type = _AI_ISSUE_TYPE_MAP.get(item.get("type", "grammar"), IssueType.GRAMMAR)
+            severity = _AI_SEVERITY_MAP.get(item.get("severity", "medium"), Severity.MEDIUM)
+            
+            # 文章内の位置を特定（同じ箇所が複数回指摘された場合は次の出現位置を割り当て）
+            original_text = item.get("original", "")
+            if original_text in first_positions:
+                starts = positions[original_text]
+                start_pos = starts.popleft() if starts else first_positions[original_text]
+                end_pos = start_pos + len(original_text)
+                
+                issue = ProofreadingIssue(
+                    issue_id=f"ai_{start_pos}_{end_pos}",
+                    issue_type=issue_type,
+                    severity=severity,
+                    location={
+                        "start": start_pos,
+                        "end": end_pos,
+                        "section": section_type.value
+                    },
+                    original_text=original_text,
+                    suggested_text=item.get("suggested", ""),
+                    explanation=item.get("explanation", ""),
+                    confidence=0.8,
+                    auto_fixable=issue_type in [IssueType.GRAMMAR, IssueType.SPELLING]
+                )
+                issues.append(issue)
+        
+        return issues
+
     async def _ai_grammar_check(
         self,
         text: str,
@@ -810,6 +1397,39 @@ JSON形式で結果を出力してください。
             logger.error(f"AI文法チェックエラー: {str(e)}")
             return []
 
+    def _locate_fragments(self, text: str, fragments: set) -> Dict[str, deque]:
+        """AI指摘箇所の出現位置索引構築（全断片を1回の走査で検出）"""
+        positions = {fragment: deque() for fragment in fragments}
+        if not positions:
+            return positions
+        
+        # 他の断片に含まれる断片は一括走査では検出されないため個別に走査
+        nested = {
+            fragment for fragment in fragments
+            if any(fragment != other and fragment in other for other in fragments)
+        }
+        
+        outer = sorted(fragments - nested, key=len, reverse=True)
+        if outer:
+            pattern = re.compile('|'.join(re.escape(fragment) for fragment in outer))
+            for match in pattern.finditer(text):
+                positions[match.group(0)].append(match.start())
+        
+        for fragment in nested:
+            start_pos = text.find(fragment)
+            while start_pos >= 0:
+                positions[fragment].append(start_pos)
+                start_pos = text.find(fragment, start_pos + len(fragment))
+        
+        # 部分的に重なって検出されなかった断片は最初の出現位置のみ特定
+        for fragment, starts in positions.items():
+            if not starts:
+                start_pos = text.find(fragment)
+                if start_pos >= 0:
+                    starts.append(start_pos)
+        
+        return positions
+
     # 修正適用
 
     async def _apply_auto_fixes(
@@ -820,23 +1440,26 @@ JSON形式で結果を出力してください。
     ) -> str:
         """自動修正適用"""
         try:
-            fixed_text = text
-            
-            # 位置の逆順でソートして後ろから修正（位置ずれを防ぐ）
-            auto_fixable_issues = [i for i in issues if i.auto_fixable]
-            auto_fixable_issues.sort(key=lambda x: x.location.get("start", 0), reverse=True)
+            # 修正箇所を位置順に並べ、未修正部分と修正文字列を連結して1回で組み立てる
+            fixes = sorted(
+                (
+                    (issue.location.get("start", 0), issue.location.get("end", 0), issue.suggested_text)
+                    for issue in issues if issue.auto_fixable
+                ),
+                key=lambda fix: fix[0]
+            )
             
-            for issue in auto_fixable_issues:
-                start = issue.location.get("start", 0)
-                end = issue.location.get("end", 0)
-                
-                if 0 <= start < end <= len(fixed_text):
-                    # 修正適用
-                    fixed_text = (
-                        fixed_text[:start] + 
-                        issue.suggested_text + 
-                        fixed_text[end:]
-                    )
+            parts = []
+            cursor = 0
+            for start, end, suggested_text in fixes:
+                # 範囲外・直前の修正と重なる箇所はスキップ
+                if not (cursor <= start < end <= len(text)):
+                    continue
+                parts.append(text[cursor:start])
+                parts.append(suggested_text)
+                cursor = end
+            parts.append(text[cursor:])
+            fixed_text = "".join(parts)
             
             # 追加の一括修正
             fixed_text = await self._apply_style_guide_fixes(fixed_text, style_guide)
@@ -853,46 +1476,47 @@ JSON形式で結果を出力してください。
         style_guide: StyleGuide
     ) -> str:
         """文体ガイド修正適用"""
-        fixed_text = text
-        
-        # 推奨表現への置換
-        for old_expr, new_expr in style_guide.preferred_expressions.items():
-            fixed_text = re.sub(rf'\b{re.escape(old_expr)}\b', new_expr, fixed_text)
+        # 推奨表現への置換（文体ガイドごとにコンパイル済みパターンを再利用し1回の置換で適用）
+        expressions = style_guide.preferred_expressions
+        pattern = self._get_style_guide_pattern(
+            style_guide, "preferred", tuple(expressions), _compile_phrase_alternation
+        )
+        if pattern is None:
+            return text
         
-        return fixed_text
+        return pattern.sub(lambda m: expressions[m.group(0)], text)
 
     # 結果コンパイル
 
     async def _compile_proofreading_result(
         self,
         document_id: str,
-        all_issues: List[ProofreadingIssue],
+        issues: Iterable[ProofreadingIssue],
         improved_content: Dict[ApplicationSection, str],
         overall_quality: float,
         processing_time: float
     ) -> ProofreadingResult:
         """校正結果コンパイル"""
         
-        # 重要度別集計
+        # 問題の収集と重要度別・タイプ別集計を1回の走査で実施
+        all_issues = []
         issues_by_severity = defaultdict(int)
-        for issue in all_issues:
+        issues_by_type = defaultdict(int)
+        for issue in issues:
+            all_issues.append(issue)
             issues_by_severity[issue.severity] += 1
-        
-        # タイプ別集計
-        issues_by_type = defaultdict(int) 
-        for issue in all_issues:
             issues_by_type[issue.issue_type] += 1
         
-        # 可読性スコア算出
-        readability_score = await self._calculate_readability_score(improved_content)
-        
-        # 一貫性スコア算出
-        consistency_score = await self._calculate_consistency_score_from_content(
-            improved_content
+        # 可読性スコア・一貫性スコア算出（CPU処理のためワーカースレッドで並行実行）
+        readability_score, consistency_score = await asyncio.gather(
+            self._calculate_readability_score(improved_content),
+            asyncio.to_thread(self._calculate_consistency_score_from_content, improved_content)
         )
         
-        # 改善提案生成
-        suggestions = await self._generate_improvement_suggestions(all_issues)
+        # 改善提案生成（集計済みの件数を再利用）
+        suggestions = await self._generate_improvement_suggestions(
+            issues_by_severity, issues_by_type
+        )
         
         return ProofreadingResult(
             document_id=document_id,
@@ -911,9 +1535,9 @@ JSON形式で結果を出力してください。
 
     # ヘルパーメソッド
 
-    def _initialize_grammar_patterns(self) -> Dict[str, Dict[str, Any]]:
-        """文法パターン初期化"""
-        return {
+    def _initialize_grammar_patterns(self) -> List[Tuple[re.Pattern, Dict[str, Any]]]:
+        """文法パターン初期化（コンパイル済みパターンとルールの組）"""
+        patterns = {
             r'(\w+)が(\w+)を(\w+)が': {
                 "severity": Severity.HIGH,
                 "suggestion": "主語の重複を修正してください",
@@ -933,6 +1557,7 @@ JSON形式で結果を出力してください。
                 "auto_fixable": True
             }
         }
+        return [(re.compile(pattern), rule) for pattern, rule in patterns.items()]
 
     def _load_spelling_dictionary(self) -> Dict[str, Dict[str, str]]:
         """誤字脱字辞書読み込み"""
@@ -946,6 +1571,30 @@ JSON形式で結果を出力してください。
             }
         }
 
+    def _get_style_guide_pattern(
+        self,
+        style_guide: StyleGuide,
+        kind: str,
+        vocabulary: tuple,
+        builder
+    ) -> Optional[re.Pattern]:
+        """文体ガイド語彙パターン取得（文体ガイドごとにキャッシュし、語彙変更時のみ再構築）"""
+        cached = style_guide._compiled_patterns.get(kind)
+        if cached is not None and cached[0] == vocabulary:
+            return cached[1]
+        
+        pattern = builder(list(vocabulary))
+        style_guide._compiled_patterns[kind] = (vocabulary, pattern)
+        return pattern
+
+    def _build_spelling_pattern(self) -> Optional[re.Pattern]:
+        """誤字脱字スキャンパターン構築"""
+        if not self.common_mistakes:
+            return None
+        
+        # 長い語を優先した選択パターンで、テキストを1回走査するだけで全誤記を検出
+        return _compile_phrase_alternation(self.common_mistakes)
+
     def _load_terminology_map(self) -> Dict[str, str]:
         """用語マップ読み込み"""
         return {
@@ -954,42 +1603,16 @@ JSON形式で結果を出力してください。
             "DX": "デジタルトランスフォーメーション（DX）"
         }
 
-    def _map_ai_issue_type(self, ai_type: str) -> IssueType:
-        """AI問題タイプマッピング"""
-        mapping = {
-            "grammar": IssueType.GRAMMAR,
-            "style": IssueType.STYLE_INCONSISTENCY,
-            "clarity": IssueType.CLARITY,
-            "content": IssueType.COHERENCE
-        }
-        return mapping.get(ai_type, IssueType.GRAMMAR)
-
-    def _map_ai_severity(self, ai_severity: str) -> Severity:
-        """AI重要度マッピング"""
-        mapping = {
-            "high": Severity.HIGH,
-            "medium": Severity.MEDIUM,
-            "low": Severity.LOW
-        }
-        return mapping.get(ai_severity, Severity.MEDIUM)
-
-    async def _detect_terminology_variations(self, text: str) -> List[List[Tuple[str, int]]]:
+    def _detect_terminology_variations(self, text: str) -> List[List[Tuple[str, int]]]:
         """用語バリエーション検出"""
         # 簡易実装 - 実際はより高度な類似語検出を実装
-        words = re.findall(r'\w+', text)
-        word_counts = Counter(words)
-        
-        # 類似語グループ（例）
-        similar_groups = [
-            ["実施", "実行", "遂行"],
-            ["効果", "効能", "成果"],
-            ["検討", "検証", "確認"]
-        ]
+        # 全単語を数えず、類似語グループの語だけを1回の走査で集計
+        word_counts = Counter(_SIMILAR_TERM_RE.findall(text))
         
         variations = []
-        for group in similar_groups:
-            group_counts = [(word, word_counts.get(word, 0)) for word in group]
-            group_counts = [(word, count) for word, count in group_counts if count > 0]
+        for group in _SIMILAR_TERM_GROUPS:
+            # Counter には出現した語のみ含まれるため、1回の辞書引きで件数を取得
+            group_counts = [(word, word_counts[word]) for word in group if word in word_counts]
             if len(group_counts) > 1:
                 variations.append(group_counts)
         
@@ -999,37 +1622,37 @@ JSON形式で結果を出力してください。
         self,
         content: Dict[ApplicationSection, str]
     ) -> float:
-        """可読性スコア計算"""
+        """可読性スコア計算（セクションごとの分析はワーカースレッドで並行実行）"""
         try:
-            total_score = 0
-            section_count = 0
-            
-            for section, text in content.items():
-                if text.strip():
-                    section_score = await self._analyze_readability(text)
-                    total_score += section_score.get("score", 70)
-                    section_count += 1
+            section_scores = await asyncio.gather(*[
+                asyncio.to_thread(self._analyze_readability, text)
+                for text in content.values() if text.strip()
+            ])
             
-            return total_score / section_count if section_count > 0 else 70.0
+            total_score = sum(section_score.get("score", 70) for section_score in section_scores)
+            return total_score / len(section_scores) if section_scores else 70.0
             
         except Exception as e:
             logger.error(f"可読性スコア計算エラー: {str(e)}")
             return 70.0
 
-    async def _analyze_readability(self, text: str) -> Dict[str, Any]:
+    def _analyze_readability(self, text: str) -> Dict[str, Any]:
         """可読性分析"""
         try:
-            # 基本統計
-            sentences = len(re.split(r'[。！？]', text))
-            words = len(re.findall(r'\w+', text))
+            # 基本統計（分割結果や単語リストを作らず、一致数のみを計数）
+            # 文数・難読語数（漢字3文字以上）は長文ではnumpyで一括算出
+            if len(text) >= READABILITY_VECTORIZE_MIN_LENGTH:
+                sentences, difficult_words = _vectorized_readability_counts(text)
+            else:
+                sentences = _count_matches(_SENTENCE_END_RE, text) + 1
+                difficult_words = _count_matches(_KANJI3_RE, text)
+            # \w はUnicode単語文字の判定が必要なため正規表現で計数
+            words = _count_matches(_WORD_RE, text)
             characters = len(text)
             
             # 平均文長
             avg_sentence_length = characters / sentences if sentences > 0 else 0
             
-            # 難読語数（漢字3文字以上）
-            difficult_words = len(re.findall(r'[\u4e00-\u9faf]{3,}', text))
-            
             # 可読性スコア計算（簡易版）
             readability_score = 100
             
@@ -1069,23 +1692,20 @@ JSON形式で結果を出力してください。
 
     async def _generate_improvement_suggestions(
         self,
-        issues: List[ProofreadingIssue]
+        issues_by_severity: Dict[Severity, int],
+        issue_types: Dict[IssueType, int]
     ) -> List[str]:
-        """改善提案生成"""
+        """改善提案生成（重要度別・タイプ別の問題件数から生成）"""
         suggestions = []
         
         # 重要度・頻度別提案
-        critical_issues = [i for i in issues if i.severity == Severity.CRITICAL]
-        if critical_issues:
+        if issues_by_severity.get(Severity.CRITICAL, 0) > 0:
             suggestions.append("致命的な問題があります。最優先で修正してください。")
         
-        high_issues = [i for i in issues if i.severity == Severity.HIGH]
-        if len(high_issues) > 5:
+        if issues_by_severity.get(Severity.HIGH, 0) > 5:
             suggestions.append("重要度の高い問題が多数あります。段階的に修正することを推奨します。")
         
         # タイプ別提案
-        issue_types = Counter([i.issue_type for i in issues])
-        
         if issue_types.get(IssueType.GRAMMAR, 0) > 3:
             suggestions.append("文法エラーが多いため、文章構造の見直しを推奨します。")
         
@@ -1104,7 +1724,8 @@ JSON形式で結果を出力してください。
         section: ApplicationSection,
         generated_section: GeneratedSection,
         style_guide: StyleGuide,
-        focus_areas: Optional[List[IssueType]] = None
+        focus_areas: Optional[List[IssueType]] = None,
+        ai_issues: Optional[List[ProofreadingIssue]] = None
     ) -> List[ProofreadingIssue]:
         """セクション校正"""
         try:
@@ -1115,7 +1736,7 @@ JSON形式で結果を出力してください。
                 "word_count": generated_section.word_count
             }
             
-            issues = await self.proofread_text(text, section, context, style_guide)
+            issues = await self.proofread_text(text, section, context, style_guide, ai_issues)
             
             # フォーカスエリアでフィルタリング
             if focus_areas:
@@ -1136,17 +1757,14 @@ JSON形式で結果を出力してください。
         issues = []
         
         try:
-            # セクション間の用語統一チェック
-            terminology_issues = await self._check_terminology_consistency(document)
-            issues.extend(terminology_issues)
-            
-            # 数値表記統一チェック
-            numeric_issues = await self._check_numeric_consistency(document)
-            issues.extend(numeric_issues)
-            
-            # 文体統一チェック
-            style_issues = await self._check_style_consistency_across_sections(document)
-            issues.extend(style_issues)
+            # 用語統一・数値表記統一・文体統一チェックは互いに独立しているため並行実行
+            # （正規表現走査が主体のCPU処理のため、ワーカースレッドで実行しイベントループを塞がない）
+            for check_issues in await asyncio.gather(
+                asyncio.to_thread(self._check_terminology_consistency, document),
+                asyncio.to_thread(self._check_numeric_consistency, document),
+                asyncio.to_thread(self._check_style_consistency_across_sections, document)
+            ):
+                issues.extend(check_issues)
             
             return issues
             
@@ -1154,7 +1772,7 @@ JSON形式で結果を出力してください。
             logger.error(f"文書一貫性チェックエラー: {str(e)}")
             return []
 
-    async def _check_terminology_consistency(
+    def _check_terminology_consistency(
         self,
         document: ApplicationDocument
     ) -> List[ProofreadingIssue]:
@@ -1166,17 +1784,22 @@ JSON形式で結果を出力してください。
             all_terminology = {}
             
             for section, generated_section in document.sections.items():
-                terms = re.findall(r'[\u4e00-\u9faf]{2,}', generated_section.content)
+                terms = self._extract_terms(generated_section.content)
                 for term in terms:
                     if term not in all_terminology:
                         all_terminology[term] = []
                     all_terminology[term].append(section)
             
+            # 類似判定は同じ長さの用語同士でのみ成立するため、文字数ごとに分類して比較対象を限定
+            terms_by_length = defaultdict(list)
+            for term in all_terminology:
+                terms_by_length[len(term)].append(term)
+            
             # 類似用語の検出と統一提案
             for term, sections in all_terminology.items():
                 if len(sections) > 1:
                     # 同じ意味の異なる表記を検出（簡易版）
-                    similar_terms = [t for t in all_terminology.keys() 
+                    similar_terms = [t for t in terms_by_length[len(term)]
                                    if t != term and self._are_similar_terms(term, t)]
                     
                     if similar_terms:
@@ -1206,7 +1829,7 @@ JSON形式で結果を出力してください。
             logger.error(f"用語一貫性チェックエラー: {str(e)}")
             return []
 
-    async def _check_numeric_consistency(
+    def _check_numeric_consistency(
         self,
         document: ApplicationDocument
     ) -> List[ProofreadingIssue]:
@@ -1214,29 +1837,25 @@ JSON形式で結果を出力してください。
         issues = []
         
         try:
-            # 数値表記パターンを収集
-            number_patterns = {
-                "arabic": r'\d+',           # アラビア数字
-                "kanji": r'[一二三四五六七八九十百千万億]+',  # 漢数字
-                "percentage": r'\d+%',      # パーセンテージ
-                "currency": r'\d+円'        # 通貨
-            }
-            
-            pattern_usage = defaultdict(list)
+            # 数値表記パターンを収集（セクションごとに1回の走査）
+            pattern_usage = {pattern_type: [] for pattern_type in _NUMBER_PATTERN_TYPES}
             
             for section, generated_section in document.sections.items():
-                text = generated_section.content
-                
-                for pattern_type, pattern in number_patterns.items():
-                    matches = re.findall(pattern, text)
-                    if matches:
-                        pattern_usage[pattern_type].extend([(section, match) for match in matches])
+                for match in _NUMBER_RE.finditer(generated_section.content):
+                    if match.lastgroup == "kanji":
+                        pattern_usage["kanji"].append((section, match.group()))
+                        continue
+                    
+                    pattern_usage["arabic"].append((section, match.group("arabic")))
+                    suffix = match.group("suffix")
+                    if suffix:
+                        pattern_usage[_NUMBER_SUFFIX_TYPES[suffix]].append((section, match.group()))
             
             # 混在パターンをチェック
             for pattern_type, usage_list in pattern_usage.items():
                 if len(usage_list) > 1:
                     # 同じタイプの数値表記が混在している場合の統一提案
-                    sections_with_pattern = list(set([section for section, _ in usage_list]))
+                    sections_with_pattern = list(dict.fromkeys(section for section, _ in usage_list))
                     
                     if len(sections_with_pattern) > 1:
                         issue = ProofreadingIssue(
@@ -1257,7 +1876,7 @@ JSON形式で結果を出力してください。
             logger.error(f"数値表記一貫性チェックエラー: {str(e)}")
             return []
 
-    async def _check_style_consistency_across_sections(
+    def _check_style_consistency_across_sections(
         self,
         document: ApplicationDocument
     ) -> List[ProofreadingIssue]:
@@ -1276,9 +1895,9 @@ JSON形式で結果を出力してください。
             # 文体の一貫性をチェック
             if len(section_styles) > 1:
                 # 敬語レベルの一貫性
-                honorific_levels = [features.get("honorific_level", 0) 
-                                  for features in section_styles.values()]
-                honorific_variance = max(honorific_levels) - min(honorific_levels)
+                honorific_variance = _value_range(
+                    features.get("honorific_level", 0) for features in section_styles.values()
+                )
                 
                 if honorific_variance > 2:  # 閾値
                     issue = ProofreadingIssue(
@@ -1294,9 +1913,9 @@ JSON形式で結果を出力してください。
                     issues.append(issue)
                 
                 # 文長の一貫性
-                avg_sentence_lengths = [features.get("avg_sentence_length", 0) 
-                                       for features in section_styles.values()]
-                length_variance = max(avg_sentence_lengths) - min(avg_sentence_lengths)
+                length_variance = _value_range(
+                    features.get("avg_sentence_length", 0) for features in section_styles.values()
+                )
                 
                 if length_variance > 30:  # 閾値
                     issue = ProofreadingIssue(
@@ -1391,11 +2010,11 @@ JSON形式で結果を出力してください。
     ) -> float:
         """文書全体品質評価"""
         try:
-            quality_evaluator = self.quality_evaluator
-            
             # 各セクションの品質スコア平均
-            section_scores = [section.quality_score for section in document.sections.values()]
-            avg_section_quality = sum(section_scores) / len(section_scores) if section_scores else 0
+            sections = document.sections.values()
+            avg_section_quality = (
+                sum(section.quality_score for section in sections) / len(sections) if sections else 0
+            )
             
             # 文書全体の一貫性評価
             consistency_score = document.consistency_score if hasattr(document, 'consistency_score') else 75.0
@@ -1423,18 +2042,11 @@ JSON形式で結果を出力してください。
     ) -> float:
         """一貫性スコア計算"""
         try:
-            base_score = 100.0
-            
-            # 問題の重要度に応じて減点
-            for issue in consistency_issues:
-                if issue.severity == Severity.CRITICAL:
-                    base_score -= 15
-                elif issue.severity == Severity.HIGH:
-                    base_score -= 10
-                elif issue.severity == Severity.MEDIUM:
-                    base_score -= 5
-                elif issue.severity == Severity.LOW:
-                    base_score -= 2
+            # 問題の重要度に応じて減点（減点表の参照のみで分岐なし）
+            base_score = 100.0 - sum(
+                _CONSISTENCY_SEVERITY_PENALTIES.get(issue.severity, 0)
+                for issue in consistency_issues
+            )
             
             return max(0.0, base_score)
             
@@ -1442,7 +2054,7 @@ JSON形式で結果を出力してください。
             logger.error(f"一貫性スコア計算エラー: {str(e)}")
             return 70.0
 
-    async def _calculate_consistency_score_from_content(
+    def _calculate_consistency_score_from_content(
         self,
         content: Dict[ApplicationSection, str]
     ) -> float:
@@ -1451,14 +2063,15 @@ JSON形式で結果を出力してください。
             if not content:
                 return 70.0
             
-            # 用語の一貫性
-            all_terms = []
+            # 用語の一貫性（全用語リストを作らず、総数と異なり数を1回の走査で集計）
+            total_terms = 0
+            unique_terms = set()
             for text in content.values():
-                terms = re.findall(r'[\u4e00-\u9faf]{2,}', text)
-                all_terms.extend(terms)
+                terms = self._extract_terms(text)
+                total_terms += len(terms)
+                unique_terms.update(terms)
             
-            unique_terms = set(all_terms)
-            term_consistency = len(unique_terms) / len(all_terms) if all_terms else 1.0
+            term_consistency = len(unique_terms) / total_terms if total_terms else 1.0
             
             # 文体の一貫性
             style_scores = []
@@ -1484,16 +2097,16 @@ JSON形式で結果を出力してください。
         """一貫性改善推奨事項生成"""
         recommendations = []
         
-        # 問題タイプ別の推奨事項
-        issue_types = Counter([issue.issue_type for issue in consistency_issues])
+        # 問題タイプ別の推奨事項（出現有無のみ判定するため件数は数えない）
+        issue_types = {issue.issue_type for issue in consistency_issues}
         
-        if issue_types.get(IssueType.TERMINOLOGY, 0) > 0:
+        if IssueType.TERMINOLOGY in issue_types:
             recommendations.append("用語集を作成し、文書全体で用語を統一してください")
         
-        if issue_types.get(IssueType.STYLE_INCONSISTENCY, 0) > 0:
+        if IssueType.STYLE_INCONSISTENCY in issue_types:
             recommendations.append("文体ガイドラインを作成し、一貫した文体を維持してください")
         
-        if issue_types.get(IssueType.COHERENCE, 0) > 0:
+        if IssueType.COHERENCE in issue_types:
             recommendations.append("セクション間の論理的つながりを強化してください")
         
         return recommendations
@@ -1522,6 +2135,22 @@ JSON形式で結果を出力してください。
         
         return improvements
 
+    async def _generate_improved_texts_batch(
+        self,
+        items: List[Tuple[str, List[str]]],
+        concurrency: int = SECTION_PROOFREADING_CONCURRENCY
+    ) -> List[str]:
+        """改善版テキスト一括生成（同時実行数を制限して並行実行、結果は入力順）"""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def generate_bounded(text, improvements):
+            async with semaphore:
+                return await self._generate_improved_text(text, improvements)
+        
+        return await asyncio.gather(*[
+            generate_bounded(text, improvements) for text, improvements in items
+        ])
+
     async def _generate_improved_text(
         self,
         text: str,
@@ -1557,35 +2186,74 @@ JSON形式で結果を出力してください。
             logger.error(f"改善版テキスト生成エラー: {str(e)}")
             return text
 
+    def _extract_terms(self, text: str) -> List[str]:
+        """
+        用語抽出
+        
+        形態素解析器が利用可能な場合は2文字以上の名詞を、
+        利用できない場合は漢字2文字以上の連続を用語とみなす
+        """
+        if self.tagger is None:
+            return _KANJI2_RE.findall(text)
+        
+        with self._tagger_lock:
+            return [
+                word.surface for word in self.tagger(text)
+                if word.feature.pos1 == "名詞" and len(word.surface) >= 2
+            ]
+
     def _are_similar_terms(self, term1: str, term2: str) -> bool:
         """類似用語判定"""
         # 簡易的な類似度判定
         if len(term1) != len(term2):
             return False
         
-        # 文字レベルの類似度
-        common_chars = sum(1 for c1, c2 in zip(term1, term2) if c1 == c2)
-        similarity = common_chars / len(term1)
+        # 文字レベルの類似度（許容不一致数を超えた時点で打ち切り）
+        allowed_mismatches = len(term1) - _min_common_chars(len(term1))
+        mismatches = 0
+        for c1, c2 in zip(term1, term2):
+            if c1 != c2:
+                mismatches += 1
+                if mismatches > allowed_mismatches:
+                    return False
         
-        return similarity > 0.7
+        return True
 
     def _analyze_text_style(self, text: str) -> Dict[str, Any]:
-        """テキスト文体分析"""
+        """テキスト文体分析（同一本文の再分析はキャッシュから返す）"""
+        with self._text_style_cache_lock:
+            cached_features = self.text_style_cache.get(text)
+            if cached_features is not None:
+                self.text_style_cache.move_to_end(text)
+                return dict(cached_features)
+        
+        style_features = self._compute_text_style(text)
+        
+        with self._text_style_cache_lock:
+            self.text_style_cache[text] = style_features
+            self.text_style_cache.move_to_end(text)
+            while len(self.text_style_cache) > TEXT_STYLE_CACHE_SIZE:
+                self.text_style_cache.popitem(last=False)
+        
+        # 呼び出し側での変更がキャッシュに波及しないよう複製を返す
+        return dict(style_features)
+
+    def _compute_text_style(self, text: str) -> Dict[str, Any]:
+        """テキスト文体特徴算出"""
         try:
             # 基本統計
-            sentences = re.split(r'[。！？]', text)
+            sentences = _SENTENCE_END_RE.split(text)
             sentences = [s.strip() for s in sentences if s.strip()]
             
             # 平均文長
             avg_sentence_length = sum(len(s) for s in sentences) / len(sentences) if sentences else 0
             
-            # 敬語レベル分析
-            honorific_patterns = [r'です', r'ます', r'いたし', r'ござい']
-            honorific_count = sum(len(re.findall(pattern, text)) for pattern in honorific_patterns)
+            # 敬語レベル分析（固定文字列のため正規表現を使わず語ごとに計数）
+            honorific_count = sum(map(text.count, _HONORIFIC_WORDS))
             honorific_level = min(5, honorific_count / len(sentences)) if sentences else 0
             
             # 受動態使用率
-            passive_count = len(re.findall(r'れる|られる', text))
+            passive_count = _count_matches(_PASSIVE_RE, text)
             passive_ratio = passive_count / len(sentences) if sentences else 0
             
             # 一貫性スコア（簡易計算）
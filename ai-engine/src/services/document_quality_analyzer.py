@@ -3,17 +3,69 @@
 自動文法チェック、専門用語適切性、論理構造評価
 """
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-import asyncio
+from functools import partial
+from collections import OrderedDict
+from itertools import chain
+import copy
+import hashlib
+import heapq
 import logging
 import re
 import json
 
+import numpy as np
+
+# 複数キーワードの一括検出（任意）
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# 品質分析結果キャッシュの最大保持件数
+QUALITY_ANALYSIS_CACHE_SIZE = 128
+
+# 基本的な文法チェックルール（コンパイル済みパターンとルールの組）
+# 実際はより高度なNLPツールを使用
+_GRAMMAR_RULES = [
+    (re.compile(r'です。です。'), {
+        'description': '同じ語尾が連続しています',
+        'suggestion': '文の終わり方を変化させましょう',
+        'severity': 'minor'
+    }),
+    (re.compile(r'[。！？][\s]*[あ-ん]'), {
+        'description': '文頭の助詞使用',
+        'suggestion': '文頭に助詞を避け、主語を明確にしましょう',
+        'severity': 'major'
+    }),
+    (re.compile(r'[、]{2,}'), {
+        'description': '読点の重複',
+        'suggestion': '読点の使用を整理しましょう',
+        'severity': 'minor'
+    })
+]
+
+# 優先修正項目選定用の重要度の重み
+_SEVERITY_WEIGHTS = {"critical": 3, "major": 2, "minor": 1}
+
+# 重要度別の修正所要時間（分）
+_FIX_TIME_PER_SEVERITY = {"critical": 30, "major": 15, "minor": 5}
+
+# 数値データパターン
+_NUMBER_RE = re.compile(r'\d+[\d,]*[万億千百十]?[円年月日%件社人]')
+
+# 読みやすさチェック用の文字コード（文字コード配列に対する一括判定に使用）
+_SENTENCE_END_CODES = np.array([ord(c) for c in '。！？'], dtype=np.uint32)
+_KANJI_CODE_RANGE = (ord('一'), ord('龯'))
+# 空白文字（正規表現の \s と同じ str.isspace() 基準。U+3000 が最大の空白文字）
+_WHITESPACE_CODES = np.array([c for c in range(0x3001) if chr(c).isspace()], dtype=np.uint32)
+
 
 class QualityCheckType(Enum):
     """品質チェックタイプ"""
@@ -25,7 +77,7 @@ class QualityCheckType(Enum):
     COMPLIANCE = "compliance"
 
 
-@dataclass
+@dataclass(slots=True)
 class QualityIssue:
     """品質問題"""
     check_type: QualityCheckType
@@ -36,7 +88,25 @@ class QualityIssue:
     impact_score: float  # 修正による改善予測スコア
 
 
-@dataclass
+# 文法ルールごとの (パターン, 問題生成関数, 減点)。固定項目は事前に束縛し、検出時は位置のみ指定
+_GRAMMAR_ISSUE_FACTORIES = [
+    (
+        pattern,
+        partial(
+            QualityIssue,
+            check_type=QualityCheckType.GRAMMAR,
+            severity=rule['severity'],
+            description=rule['description'],
+            suggestion=rule['suggestion'],
+            impact_score=3.0 if rule['severity'] == 'major' else 1.0
+        ),
+        3.0 if rule['severity'] == 'major' else 1.0
+    )
+    for pattern, rule in _GRAMMAR_RULES
+]
+
+
+@dataclass(slots=True)
 class QualityAnalysisResult:
     """品質分析結果"""
     overall_score: float
@@ -52,6 +122,9 @@ class DocumentQualityAnalyzer:
     """文書品質分析サービス"""
     
     def __init__(self):
+        # 品質分析結果キャッシュ（文書タイプ+文書内容のハッシュ → 分析結果、LRU）
+        self.analysis_cache: OrderedDict[str, QualityAnalysisResult] = OrderedDict()
+        
         # 専門用語辞書（実際はより大規模）
         self.terminology_dict = {
             "適切": {
@@ -87,6 +160,29 @@ class DocumentQualityAnalyzer:
             "市場で初",
             "特許技術"
         ]
+        
+        # 論理的な接続詞
+        self.connective_words = ["そのため", "また", "一方", "さらに", "結果として", "このように"]
+        
+        # 補助金申請書の必須要素
+        self.required_elements = [
+            "事業概要",
+            "市場分析",
+            "実施計画",
+            "予算計画",
+            "効果測定"
+        ]
+        
+        # キーワード一括検出用オートマトン（全キーワードの出現有無を1回の走査で判定）
+        self.keywords = {
+            *self.terminology_dict["避けるべき"],
+            *self.terminology_dict["適切"],
+            *self.persuasive_phrases,
+            *self.connective_words,
+            *self.required_elements,
+            *(section for sections in self.logic_patterns.values() for section in sections)
+        }
+        self.keyword_automaton = self._build_keyword_automaton(self.keywords)
     
     async def analyze_document_quality(
         self,
@@ -98,25 +194,33 @@ class DocumentQualityAnalyzer:
         ユーザーファースト：具体的で実行可能な改善提案
         """
         try:
-            # 各種品質チェックを並列実行
-            tasks = [
-                self._check_grammar(document),
-                self._check_terminology(document),
-                self._check_logic_structure(document, document_type),
-                self._check_persuasiveness(document),
-                self._check_readability(document),
-                self._check_compliance(document, document_type)
-            ]
+            # 同一内容の文書の再分析はキャッシュから返す
+            cache_key = self._analysis_cache_key(document, document_type)
+            cached_result = self.analysis_cache.get(cache_key)
+            if cached_result is not None:
+                self.analysis_cache.move_to_end(cache_key)
+                return copy.deepcopy(cached_result)
             
-            results = await asyncio.gather(*tasks)
+            # テキスト抽出とキーワードの出現有無判定は1回だけ行い、各チェックで共有
+            text_content = self._extract_text_content(document)
+            found_keywords = self._find_keywords(text_content)
             
-            # 結果統合
-            all_issues = []
-            category_scores = {}
+            # 各種品質チェックを実行（I/Oを伴わないCPU処理のため直接呼び出す）
+            results = [
+                self._check_grammar(text_content),
+                self._check_terminology(found_keywords),
+                self._check_logic_structure(document, document_type, found_keywords),
+                self._check_persuasiveness(text_content, found_keywords),
+                self._check_readability(text_content),
+                self._check_compliance(document_type, found_keywords)
+            ]
             
-            for check_type, (score, issues) in zip(QualityCheckType, results):
-                category_scores[check_type.value] = score
-                all_issues.extend(issues)
+            # 結果統合（各チェックの問題リストは1回の連結で統合）
+            category_scores = {
+                check_type.value: score
+                for check_type, (score, _) in zip(QualityCheckType, results)
+            }
+            all_issues = list(chain.from_iterable(issues for _, issues in results))
             
             # 総合スコア計算
             weights = {
@@ -147,7 +251,7 @@ class DocumentQualityAnalyzer:
             # 修正時間の予測
             estimated_time = self._estimate_fix_time(all_issues)
             
-            return QualityAnalysisResult(
+            result = QualityAnalysisResult(
                 overall_score=round(overall_score, 1),
                 category_scores={k: round(v, 1) for k, v in category_scores.items()},
                 issues=all_issues,
@@ -157,67 +261,38 @@ class DocumentQualityAnalyzer:
                 priority_fixes=priority_fixes
             )
             
+            self._store_analysis_result(cache_key, result)
+            return result
+            
         except Exception as e:
             logger.error(f"Document quality analysis error: {str(e)}")
             raise
     
-    async def _check_grammar(self, document: Dict[str, Any]) -> Tuple[float, List[QualityIssue]]:
+    def _check_grammar(self, text_content: str) -> Tuple[float, List[QualityIssue]]:
         """文法チェック"""
         issues = []
-        text_content = self._extract_text_content(document)
-        
-        # 基本的な文法チェック（実際はより高度なNLPツールを使用）
-        grammar_patterns = {
-            r'です。です。': {
-                'description': '同じ語尾が連続しています',
-                'suggestion': '文の終わり方を変化させましょう',
-                'severity': 'minor'
-            },
-            r'[。！？][\s]*[あ-ん]': {
-                'description': '文頭の助詞使用',
-                'suggestion': '文頭に助詞を避け、主語を明確にしましょう',
-                'severity': 'major'
-            },
-            r'[、]{2,}': {
-                'description': '読点の重複',
-                'suggestion': '読点の使用を整理しましょう',
-                'severity': 'minor'
-            },
-            r'[ら抜き言葉パターン]': {
-                'description': 'ら抜き言葉',
-                'suggestion': '正しい敬語表現を使用しましょう',
-                'severity': 'major'
-            }
-        }
         
         grammar_score = 85.0  # ベーススコア
         
-        for pattern, rule in grammar_patterns.items():
-            if pattern != '[ら抜き言葉パターン]':  # 実際のパターンではないため
-                matches = re.finditer(pattern, text_content)
-                for match in matches:
-                    issues.append(QualityIssue(
-                        check_type=QualityCheckType.GRAMMAR,
-                        severity=rule['severity'],
-                        location=f"位置: {match.start()}-{match.end()}",
-                        description=rule['description'],
-                        suggestion=rule['suggestion'],
-                        impact_score=3.0 if rule['severity'] == 'major' else 1.0
-                    ))
-                    grammar_score -= (3.0 if rule['severity'] == 'major' else 1.0)
+        # 基本的な文法チェック（モジュール読み込み時にコンパイル済みのルールを使用）
+        for pattern, make_issue, penalty in _GRAMMAR_ISSUE_FACTORIES:
+            for match in pattern.finditer(text_content):
+                issues.append(make_issue(location=f"位置: {match.start()}-{match.end()}"))
+                grammar_score -= penalty
         
         return max(grammar_score, 0), issues
     
-    async def _check_terminology(self, document: Dict[str, Any]) -> Tuple[float, List[QualityIssue]]:
+    def _check_terminology(
+        self,
+        found_keywords: Set[str]
+    ) -> Tuple[float, List[QualityIssue]]:
         """専門用語適切性チェック"""
         issues = []
-        text_content = self._extract_text_content(document)
-        
         terminology_score = 80.0
         
         # 不適切な表現のチェック
         for inappropriate, description in self.terminology_dict["避けるべき"].items():
-            if inappropriate in text_content:
+            if inappropriate in found_keywords:
                 issues.append(QualityIssue(
                     check_type=QualityCheckType.TERMINOLOGY,
                     severity='major',
@@ -229,10 +304,9 @@ class DocumentQualityAnalyzer:
                 terminology_score -= 4.0
         
         # 適切な専門用語の使用確認
-        appropriate_terms_used = 0
-        for term in self.terminology_dict["適切"].keys():
-            if term in text_content:
-                appropriate_terms_used += 1
+        appropriate_terms_used = sum(
+            1 for term in self.terminology_dict["適切"] if term in found_keywords
+        )
         
         # 専門用語使用率によるボーナス
         if appropriate_terms_used >= 3:
@@ -240,10 +314,11 @@ class DocumentQualityAnalyzer:
         
         return min(terminology_score, 100), issues
     
-    async def _check_logic_structure(
+    def _check_logic_structure(
         self, 
         document: Dict[str, Any], 
-        document_type: str
+        document_type: str,
+        found_keywords: Set[str]
     ) -> Tuple[float, List[QualityIssue]]:
         """論理構造チェック"""
         issues = []
@@ -252,18 +327,15 @@ class DocumentQualityAnalyzer:
         # 文書タイプに応じた構造チェック
         required_sections = self.logic_patterns.get("business_plan", [])
         
+        # トップレベルの文字列項目を連結後に1回だけ小文字化・走査し、出現するセクション名を一括判定
+        top_level_text = '\n'.join(
+            value for value in document.values() if isinstance(value, str)
+        ).lower()
+        found_sections = self._find_keywords(top_level_text)
+        
         present_sections = []
         for section in required_sections:
-            section_found = False
-            for key, value in document.items():
-                if isinstance(value, str) and any(
-                    keyword in value.lower() 
-                    for keyword in [section, section.replace('_', ' ')]
-                ):
-                    section_found = True
-                    break
-            
-            if section_found:
+            if section in found_sections:
                 present_sections.append(section)
             else:
                 issues.append(QualityIssue(
@@ -276,12 +348,8 @@ class DocumentQualityAnalyzer:
                 ))
                 logic_score -= 8.0
         
-        # 論理的な流れのチェック
-        text_content = self._extract_text_content(document)
-        
-        # 接続詞の使用確認
-        connective_words = ["そのため", "また", "一方", "さらに", "結果として", "このように"]
-        connective_count = sum(1 for word in connective_words if word in text_content)
+        # 論理的な流れのチェック（接続詞の使用確認）
+        connective_count = sum(1 for word in self.connective_words if word in found_keywords)
         
         if connective_count < 3:
             issues.append(QualityIssue(
@@ -296,10 +364,13 @@ class DocumentQualityAnalyzer:
         
         return max(logic_score, 0), issues
     
-    async def _check_persuasiveness(self, document: Dict[str, Any]) -> Tuple[float, List[QualityIssue]]:
+    def _check_persuasiveness(
+        self,
+        text_content: str,
+        found_keywords: Set[str]
+    ) -> Tuple[float, List[QualityIssue]]:
         """説得力チェック"""
         issues = []
-        text_content = self._extract_text_content(document)
         persuasiveness_score = 70.0
         
         # 説得力のあるフレーズの使用確認
@@ -307,7 +378,7 @@ class DocumentQualityAnalyzer:
         used_phrases = []
         
         for phrase in self.persuasive_phrases:
-            if phrase in text_content:
+            if phrase in found_keywords:
                 persuasive_count += 1
                 used_phrases.append(phrase)
         
@@ -325,12 +396,12 @@ class DocumentQualityAnalyzer:
             persuasiveness_score -= 10.0
         
         # 数値データの使用確認
-        number_pattern = r'\d+[\d,]*[万億千百十]?[円年月日%件社人]'
-        numbers = re.findall(number_pattern, text_content)
+        # 件数のみ必要なため、一致文字列のリストを作らずに計数
+        number_count = sum(1 for _ in _NUMBER_RE.finditer(text_content))
         
-        if len(numbers) >= 5:
+        if number_count >= 5:
             persuasiveness_score += 8.0
-        elif len(numbers) < 2:
+        elif number_count < 2:
             issues.append(QualityIssue(
                 check_type=QualityCheckType.PERSUASIVENESS,
                 severity='major',
@@ -343,17 +414,20 @@ class DocumentQualityAnalyzer:
         
         return min(persuasiveness_score, 100), issues
     
-    async def _check_readability(self, document: Dict[str, Any]) -> Tuple[float, List[QualityIssue]]:
+    def _check_readability(self, text_content: str) -> Tuple[float, List[QualityIssue]]:
         """読みやすさチェック"""
         issues = []
-        text_content = self._extract_text_content(document)
         readability_score = 80.0
         
-        # 文の長さチェック
-        sentences = re.split('[。！？]', text_content)
-        long_sentences = [s for s in sentences if len(s) > 100]
+        # 文区切り・漢字数・空白以外の文字数を文字コード配列への一括演算で算出
+        codes = np.frombuffer(text_content.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        
+        # 文の長さチェック（文末記号で区切った各区間の文字数）
+        sentence_ends = np.flatnonzero(np.isin(codes, _SENTENCE_END_CODES))
+        sentence_lengths = np.diff(sentence_ends, prepend=-1, append=len(codes)) - 1
+        long_sentence_count = int((sentence_lengths > 100).sum())
         
-        if len(long_sentences) > len(sentences) * 0.3:  # 30%以上が長文
+        if long_sentence_count > len(sentence_lengths) * 0.3:  # 30%以上が長文
             issues.append(QualityIssue(
                 check_type=QualityCheckType.READABILITY,
                 severity='minor',
@@ -365,9 +439,8 @@ class DocumentQualityAnalyzer:
             readability_score -= 5.0
         
         # 漢字の使用率チェック
-        kanji_pattern = r'[一-龯]'
-        kanji_count = len(re.findall(kanji_pattern, text_content))
-        total_chars = len(re.sub(r'\s', '', text_content))
+        kanji_count = int(((codes >= _KANJI_CODE_RANGE[0]) & (codes <= _KANJI_CODE_RANGE[1])).sum())
+        total_chars = len(codes) - int(np.isin(codes, _WHITESPACE_CODES).sum())
         
         if total_chars > 0:
             kanji_ratio = kanji_count / total_chars
@@ -384,28 +457,18 @@ class DocumentQualityAnalyzer:
         
         return max(readability_score, 0), issues
     
-    async def _check_compliance(
+    def _check_compliance(
         self, 
-        document: Dict[str, Any], 
-        document_type: str
+        document_type: str,
+        found_keywords: Set[str]
     ) -> Tuple[float, List[QualityIssue]]:
         """要件適合性チェック"""
         issues = []
         compliance_score = 90.0
         
         # 補助金申請書の必須要素チェック
-        required_elements = [
-            "事業概要",
-            "市場分析",
-            "実施計画",
-            "予算計画",
-            "効果測定"
-        ]
-        
-        text_content = self._extract_text_content(document)
-        
-        for element in required_elements:
-            if element not in text_content and element.replace(' ', '') not in text_content:
+        for element in self.required_elements:
+            if element not in found_keywords:
                 issues.append(QualityIssue(
                     check_type=QualityCheckType.COMPLIANCE,
                     severity='critical',
@@ -418,35 +481,66 @@ class DocumentQualityAnalyzer:
         
         return max(compliance_score, 0), issues
     
+    def _analysis_cache_key(self, document: Dict[str, Any], document_type: str) -> str:
+        """
+        品質分析キャッシュキー生成（文書タイプと文書内容のハッシュ）
+        
+        分析結果の位置情報は項目の並び順に依存するため、キーは並び替えずに直列化する
+        """
+        content = json.dumps(document, ensure_ascii=False, default=str)
+        return hashlib.blake2b(f"{document_type}|{content}".encode(), digest_size=16).hexdigest()
+    
+    def _store_analysis_result(self, cache_key: str, result: QualityAnalysisResult) -> None:
+        """品質分析結果をキャッシュに保存（呼び出し側での変更が波及しないよう複製を保持）"""
+        self.analysis_cache[cache_key] = copy.deepcopy(result)
+        self.analysis_cache.move_to_end(cache_key)
+        
+        while len(self.analysis_cache) > QUALITY_ANALYSIS_CACHE_SIZE:
+            self.analysis_cache.popitem(last=False)
+    
     def _extract_text_content(self, document: Dict[str, Any]) -> str:
         """文書からテキストコンテンツを抽出"""
         text_parts = []
         
-        def extract_recursive(obj):
+        # 再帰呼び出しを使わず、明示的なスタックで深さ優先に走査（出現順は再帰版と同じ）
+        stack = [document]
+        while stack:
+            obj = stack.pop()
             if isinstance(obj, str):
                 text_parts.append(obj)
             elif isinstance(obj, dict):
-                for value in obj.values():
-                    extract_recursive(value)
+                stack.extend(reversed(obj.values()))
             elif isinstance(obj, list):
-                for item in obj:
-                    extract_recursive(item)
+                stack.extend(reversed(obj))
         
-        extract_recursive(document)
         return ' '.join(text_parts)
     
+    def _build_keyword_automaton(self, keywords: Set[str]):
+        """キーワード検出用Aho-Corasickオートマトン構築（ライブラリ未導入時はNone）"""
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+    
+    def _find_keywords(self, text_content: str) -> Set[str]:
+        """テキスト中に出現するキーワードを抽出（重なり合う出現も含めて検出）"""
+        if self.keyword_automaton is None:
+            return {keyword for keyword in self.keywords if keyword in text_content}
+        
+        return {keyword for _, keyword in self.keyword_automaton.iter(text_content)}
+    
     def _select_priority_fixes(self, issues: List[QualityIssue]) -> List[QualityIssue]:
         """優先修正項目の選定"""
-        # 重要度とインパクトで並び替え
-        severity_weights = {"critical": 3, "major": 2, "minor": 1}
-        
-        sorted_issues = sorted(
+        # 重要度とインパクトで上位5つを選定（全件の並び替えは不要）
+        return heapq.nlargest(
+            5,
             issues,
-            key=lambda x: (severity_weights[x.severity], x.impact_score),
-            reverse=True
+            key=lambda x: (_SEVERITY_WEIGHTS[x.severity], x.impact_score)
         )
-        
-        return sorted_issues[:5]  # 上位5つ
     
     async def _generate_improvement_suggestions(
         self,
@@ -499,13 +593,7 @@ class DocumentQualityAnalyzer:
     
     def _estimate_fix_time(self, issues: List[QualityIssue]) -> int:
         """修正時間の予測"""
-        time_per_severity = {"critical": 30, "major": 15, "minor": 5}
-        
-        total_time = sum(
-            time_per_severity[issue.severity] for issue in issues
-        )
-        
-        return total_time
+        return sum(map(_FIX_TIME_PER_SEVERITY.__getitem__, (issue.severity for issue in issues)))
     
     async def generate_quality_report(
         self,
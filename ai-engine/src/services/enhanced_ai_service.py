@@ -4,21 +4,36 @@
 """
 
 from typing import Dict, List, Optional, Union, Any
+from collections import OrderedDict
 import asyncio
+import copy
+import hashlib
+import itertools
 import os
 import json
+import math
+import re
 import time
-from datetime import datetime
+from datetime import datetime, date, time as datetime_time
 import logging
-from dataclasses import dataclass
+import uuid
+from dataclasses import dataclass, asdict, is_dataclass
 from enum import Enum
 
 # AI プロバイダー
+import httpx
 import openai
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic, APITimeoutError as AnthropicTimeoutError
 from langchain.chains import LLMChain
 from langchain.prompts import PromptTemplate
 
+# 高速JSONシリアライザ（任意）
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # 品質評価・監視
 from .quality_evaluator import QualityEvaluator
 from .metrics_collector import MetricsCollector
@@ -27,6 +42,128 @@ from .metrics_collector import MetricsCollector
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# AIプロバイダー共通のHTTP接続プール上限（TLSセッションを再利用）
+AI_HTTP_MAX_CONNECTIONS = 64
+AI_HTTP_MAX_KEEPALIVE_CONNECTIONS = 32
+
+# 一時的なエラー（429・5xx・接続エラー）に対するSDK内蔵リトライ（指数バックオフ+ジッター）の最大回数
+AI_PROVIDER_MAX_RETRIES = 2
+
+# 生成結果キャッシュの最大保持件数
+AI_RESPONSE_CACHE_SIZE = 256
+
+# プロンプトに埋め込むデータ1件あたりの最大文字数（コンテキスト長超過で必ず失敗する呼び出しを防止）
+PROMPT_DATA_MAX_CHARS = 12000
+
+# 上限超過時に縮約する文字列長・配列要素数の初期値（超過が続く限り半減）と文字列長の下限
+PROMPT_STRING_MAX_CHARS = 2000
+PROMPT_LIST_MAX_ITEMS = 50
+PROMPT_STRING_MIN_CHARS = 50
+
+# AI応答中のMarkdownコードブロック（```json ... ```）
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.S)
+
+# 一括採択可能性予測で1回のプロンプトにまとめる申請数
+ADOPTION_PREDICTION_BATCH_SIZE = 5
+
+# 一括採択可能性予測の出力トークン上限（申請1件あたり、およびモデルの出力上限）
+ADOPTION_PREDICTION_TOKENS_PER_APPLICATION = 1500
+ADOPTION_PREDICTION_BATCH_MAX_TOKENS = 8192
+
+
+def _to_json_compatible(value: Any) -> Any:
+    """標準jsonで直列化できない値をorjsonと同じ表現に変換（日時はISO形式、NaN・無限大はnull）"""
+    if isinstance(value, dict):
+        return {_to_json_compatible(key): _to_json_compatible(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json_compatible(item) for item in value]
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, (datetime, date, datetime_time)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return _to_json_compatible(value.value)
+    if is_dataclass(value) and not isinstance(value, type):
+        return _to_json_compatible(asdict(value))
+    return value
+
+
+def _serialize_for_prompt(data: Any) -> str:
+    """JSON文字列化（AIには整形不要のため空白なしで出力、orjson導入時はC実装で高速化）"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            # 64bit超の整数などorjson非対応の値は標準jsonで処理
+            pass
+    return json.dumps(_to_json_compatible(data), ensure_ascii=False, separators=(',', ':'))
+
+
+def _shorten_for_prompt(value: Any, max_string_chars: int, max_items: int) -> Any:
+    """長い文字列と要素数の多い配列・辞書を切り詰めたコピーを返す（省略箇所は明示）"""
+    if isinstance(value, str):
+        if len(value) > max_string_chars:
+            return value[:max_string_chars] + "…（以下省略）"
+        return value
+    if isinstance(value, dict):
+        items = list(value.items())
+        shortened = {
+            key: _shorten_for_prompt(item, max_string_chars, max_items)
+            for key, item in items[:max_items]
+        }
+        if len(items) > max_items:
+            shortened["…"] = f"他{len(items) - max_items}件省略"
+        return shortened
+    if isinstance(value, (list, tuple)):
+        shortened = [
+            _shorten_for_prompt(item, max_string_chars, max_items)
+            for item in value[:max_items]
+        ]
+        if len(value) > max_items:
+            shortened.append(f"…（他{len(value) - max_items}件省略）")
+        return shortened
+    return value
+
+
+def _dumps_for_prompt(data: Any) -> str:
+    """
+    プロンプト埋め込み用のJSON文字列化
+    AIには整形不要のため空白なしで出力し、入力トークンを削減する。
+    orjson導入時はC実装で高速化する。標準jsonで処理する場合も日時・NaN等を
+    orjsonと同じ表現に揃えるため、どちらの経路でもプロンプトの内容は変わらない。
+    PROMPT_DATA_MAX_CHARS を超える場合は文字列・配列を縮約してから直列化し、
+    常に妥当なJSONを返す
+    """
+    text = _serialize_for_prompt(data)
+    if len(text) <= PROMPT_DATA_MAX_CHARS:
+        return text
+
+    original_length = len(text)
+    max_string_chars = PROMPT_STRING_MAX_CHARS
+    max_items = PROMPT_LIST_MAX_ITEMS
+    while True:
+        text = _serialize_for_prompt(_shorten_for_prompt(data, max_string_chars, max_items))
+        if len(text) <= PROMPT_DATA_MAX_CHARS or (
+            max_string_chars <= PROMPT_STRING_MIN_CHARS and max_items <= 1
+        ):
+            break
+        max_string_chars = max(PROMPT_STRING_MIN_CHARS, max_string_chars // 2)
+        max_items = max(1, max_items // 2)
+
+    logger.warning(
+        f"プロンプト埋め込みデータを縮約しました: {original_length} -> {len(text)}文字"
+    )
+    return text
+
+
+def _loads_json(text: str) -> Any:
+    """JSONパース（orjson導入時はC実装で高速化）"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
 
 class AIProvider(Enum):
     OPENAI = "openai"
@@ -34,7 +171,7 @@ class AIProvider(Enum):
     HYBRID = "hybrid"
 
 
-@dataclass
+@dataclass(slots=True)
 class AIRequest:
     """AI リクエスト情報"""
     request_id: str
@@ -49,7 +186,7 @@ class AIRequest:
             self.timestamp = datetime.now()
 
 
-@dataclass
+@dataclass(slots=True)
 class AIResponse:
     """AI レスポンス情報"""
     request_id: str
@@ -73,12 +210,32 @@ class EnhancedAIService:
     
     def __init__(self):
         """初期化"""
-        self.openai_client = openai.OpenAI(
-            api_key=os.getenv('OPENAI_API_KEY')
+        # 両プロバイダーで共有する接続プール
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=AI_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=AI_HTTP_MAX_KEEPALIVE_CONNECTIONS
+            )
         )
-        self.anthropic_client = Anthropic(
-            api_key=os.getenv('ANTHROPIC_API_KEY')
+        self.openai_client = openai.AsyncOpenAI(
+            api_key=os.getenv('OPENAI_API_KEY'),
+            http_client=self.http_client,
+            max_retries=AI_PROVIDER_MAX_RETRIES
         )
+        self.anthropic_client = AsyncAnthropic(
+            api_key=os.getenv('ANTHROPIC_API_KEY'),
+            http_client=self.http_client,
+            max_retries=AI_PROVIDER_MAX_RETRIES
+        )
+        
+        # リクエストID採番用の連番
+        self.request_counter = itertools.count()
+        
+        # 生成結果キャッシュ（プロバイダー+プロンプトのハッシュ → 成功応答、LRU）
+        self.response_cache: OrderedDict[str, AIResponse] = OrderedDict()
+        
+        # 実行中の生成（キャッシュキー → タスク）。同一内容の同時リクエストを1回の呼び出しにまとめる
+        self.inflight_generations: Dict[str, asyncio.Task] = {}
         
         # 品質評価・監視システム
         self.quality_evaluator = QualityEvaluator()
@@ -90,16 +247,24 @@ class EnhancedAIService:
                 'model': 'gpt-4-turbo-preview',
                 'max_tokens': 4000,
                 'temperature': 0.7,
-                'timeout': 30
+                'timeout': 30,
+                'max_concurrency': 16
             },
             AIProvider.ANTHROPIC: {
                 'model': 'claude-3-5-sonnet-20241022',
                 'max_tokens': 4000,
                 'temperature': 0.5,
-                'timeout': 30
+                'timeout': 30,
+                'max_concurrency': 16
             }
         }
         
+        # プロバイダーごとの同時リクエスト数上限（レート制限超過の回避）
+        self.provider_semaphores = {
+            provider: asyncio.Semaphore(config['max_concurrency'])
+            for provider, config in self.provider_config.items()
+        }
+        
         # エラー回復設定
         self.fallback_strategies = {
             'openai_down': self._use_anthropic_fallback,
@@ -108,12 +273,23 @@ class EnhancedAIService:
             'rate_limit_exceeded': self._use_queuing_system
         }
 
+    async def aclose(self):
+        """接続プールを閉じる（アプリケーション終了時に呼び出す）"""
+        await self.http_client.aclose()
+
+    async def __aenter__(self) -> "EnhancedAIService":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
     async def generate_business_plan(
         self, 
         company_data: Dict,
         subsidy_type: str,
         custom_requirements: Optional[List[str]] = None,
-        provider: AIProvider = AIProvider.HYBRID
+        provider: AIProvider = AIProvider.HYBRID,
+        quality_gate: bool = False
     ) -> AIResponse:
         """
         事業計画書生成
@@ -123,11 +299,13 @@ class EnhancedAIService:
             subsidy_type: 補助金タイプ
             custom_requirements: カスタム要件
             provider: 使用AIプロバイダー
+            quality_gate: ハイブリッド生成で全プロバイダーの応答を待って比較するか
+                （既定は最初に成功した応答を採用）
             
         Returns:
             AIResponse: 生成結果
         """
-        request_id = f"bp_{int(time.time() * 1000)}"
+        request_id = self._new_request_id("bp")
         start_time = time.time()
         
         try:
@@ -140,7 +318,8 @@ class EnhancedAIService:
                     "company_data": company_data,
                     "subsidy_type": subsidy_type,
                     "custom_requirements": custom_requirements or []
-                }
+                },
+                options={"quality_gate": quality_gate}
             )
             
             # プロンプト構築
@@ -148,14 +327,7 @@ class EnhancedAIService:
                 company_data, subsidy_type, custom_requirements
             )
             
-            if provider == AIProvider.HYBRID:
-                # 複数AIプロバイダーによる並列生成
-                response = await self._hybrid_generation(prompt, request)
-            else:
-                # 単一プロバイダー使用
-                response = await self._single_provider_generation(
-                    prompt, request, provider
-                )
+            response = await self._generate_with_cache(prompt, request, provider)
             
             # 品質評価
             response.quality_score = await self.quality_evaluator.evaluate_business_plan(
@@ -192,7 +364,7 @@ class EnhancedAIService:
         Returns:
             AIResponse: 予測結果
         """
-        request_id = f"ap_{int(time.time() * 1000)}"
+        request_id = self._new_request_id("ap")
         start_time = time.time()
         
         try:
@@ -214,6 +386,11 @@ class EnhancedAIService:
             response.confidence_score = prediction_result.get('confidence_score', 0.7)
             response.processing_time = time.time() - start_time
             
+            # パースできなかった場合の既定値は予測結果ではないため失敗として返す
+            if 'error' in prediction_result:
+                response.success = False
+                response.error = f"予測結果{prediction_result['error']}"
+            
             return response
             
         except Exception as e:
@@ -225,6 +402,121 @@ class EnhancedAIService:
                 processing_time=time.time() - start_time
             )
 
+    async def predict_adoption_probability_batch(
+        self,
+        applications: List[Dict],
+        subsidy_program: Dict
+    ) -> List[AIResponse]:
+        """
+        採択可能性一括予測
+        
+        複数の申請を1回のプロンプトにまとめ、AI呼び出し回数を削減する
+        
+        Args:
+            applications: 申請データのリスト
+            subsidy_program: 補助金プログラム情報
+            
+        Returns:
+            List[AIResponse]: 申請ごとの予測結果（入力と同じ順序）
+        """
+        batches = [
+            applications[i:i + ADOPTION_PREDICTION_BATCH_SIZE]
+            for i in range(0, len(applications), ADOPTION_PREDICTION_BATCH_SIZE)
+        ]
+        batch_responses = await asyncio.gather(*(
+            self._predict_adoption_batch(batch, subsidy_program) for batch in batches
+        ))
+        
+        return [response for responses in batch_responses for response in responses]
+
+    async def _predict_adoption_batch(
+        self,
+        applications: List[Dict],
+        subsidy_program: Dict
+    ) -> List[AIResponse]:
+        """
+        1バッチ分の採択可能性予測（1回のAI呼び出し）
+        
+        応答から結果を得られなかった申請（パース失敗・idの欠落）は
+        predict_adoption_probability で個別に予測し直す
+        """
+        request_id = self._new_request_id("apb")
+        start_time = time.time()
+        batch_size = len(applications)
+        
+        try:
+            features_list = [
+                await self._extract_features(application_data, subsidy_program)
+                for application_data in applications
+            ]
+            
+            prompt = self._build_batch_adoption_prediction_prompt(
+                applications, subsidy_program, features_list
+            )
+            
+            # 出力量・所要時間は申請数に比例するため、出力トークン上限とタイムアウトも申請数に合わせる
+            response = await self._anthropic_request(
+                prompt,
+                max_tokens=min(
+                    ADOPTION_PREDICTION_TOKENS_PER_APPLICATION * batch_size,
+                    ADOPTION_PREDICTION_BATCH_MAX_TOKENS
+                ),
+                timeout=self.provider_config[AIProvider.ANTHROPIC]['timeout'] * batch_size
+            )
+            
+            prediction_results = self._parse_batch_prediction_result(
+                response.content, batch_size
+            )
+            
+        except Exception as e:
+            logger.error(f"採択可能性一括予測エラー: {str(e)}")
+            processing_time = time.time() - start_time
+            return [
+                AIResponse(
+                    request_id=f"{request_id}_{index}",
+                    success=False,
+                    error=str(e),
+                    processing_time=processing_time
+                )
+                for index in range(batch_size)
+            ]
+        
+        # 結果を得られなかった申請は単体予測で再実行
+        missing_indices = [
+            index for index, prediction_result in enumerate(prediction_results)
+            if prediction_result is None
+        ]
+        if missing_indices:
+            logger.warning(
+                f"一括予測で結果を得られなかった申請を個別に再予測: {len(missing_indices)}/{batch_size}件"
+            )
+        fallback_responses = dict(zip(missing_indices, await asyncio.gather(*(
+            self.predict_adoption_probability(applications[index], subsidy_program)
+            for index in missing_indices
+        ))))
+        processing_time = time.time() - start_time
+        
+        # 一括呼び出しのコストは申請数で按分（再予測分はその呼び出しのコストを加算）
+        cost_share = response.cost / batch_size
+        for index, fallback_response in fallback_responses.items():
+            fallback_response.request_id = f"{request_id}_{index}"
+            fallback_response.processing_time = processing_time
+            fallback_response.cost += cost_share
+        
+        return [
+            fallback_responses[index] if prediction_result is None else AIResponse(
+                request_id=f"{request_id}_{index}",
+                success=True,
+                content=json.dumps(prediction_result, ensure_ascii=False, indent=2),
+                provider=response.provider,
+                metadata={**response.metadata, 'batch_size': batch_size},
+                processing_time=processing_time,
+                confidence_score=prediction_result.get('confidence_score', 0.7),
+                cost=cost_share
+            )
+            for index, prediction_result in enumerate(prediction_results)
+        ]
+
     async def analyze_document(
         self,
         document_text: str,
@@ -240,7 +532,7 @@ class EnhancedAIService:
         Returns:
             AIResponse: 解析結果
         """
-        request_id = f"da_{int(time.time() * 1000)}"
+        request_id = self._new_request_id("da")
         start_time = time.time()
         
         try:
@@ -248,7 +540,7 @@ class EnhancedAIService:
             prompt = self._build_document_analysis_prompt(document_text, analysis_type)
             
             # GPT-4使用（詳細分析に最適）
-            response = await self._openai_request(prompt)
+            response = await self._generate_with_cache(prompt, None, AIProvider.OPENAI)
             
             # 解析結果構造化
             analysis_result = self._parse_document_analysis(response.content)
@@ -267,6 +559,148 @@ class EnhancedAIService:
                 processing_time=time.time() - start_time
             )
 
+    async def generate_text(
+        self,
+        prompt: str,
+        provider: AIProvider = AIProvider.ANTHROPIC,
+        options: Optional[Dict] = None
+    ) -> AIResponse:
+        """
+        汎用テキスト生成（校正・申請書各セクション生成などの共通入口）
+        
+        Args:
+            prompt: プロンプト
+            provider: 使用AIプロバイダー
+            options: 生成オプション（temperature を指定するとプロバイダー設定値より優先）
+            
+        Returns:
+            AIResponse: 生成結果（失敗時も例外ではなく success=False で返す）
+        """
+        request_id = self._new_request_id("txt")
+        start_time = time.time()
+        
+        try:
+            request = AIRequest(
+                request_id=request_id,
+                user_id="system",
+                task_type="text_generation",
+                input_data={},
+                options=options
+            )
+            
+            response = await self._generate_with_cache(prompt, request, provider)
+            response.request_id = request_id
+            response.processing_time = time.time() - start_time
+            return response
+            
+        except Exception as e:
+            logger.error(f"テキスト生成エラー: {str(e)}")
+            return AIResponse(
+                request_id=request_id,
+                success=False,
+                error=str(e),
+                processing_time=time.time() - start_time
+            )
+
+    def _new_request_id(self, prefix: str) -> str:
+        """リクエストID生成（連番+乱数で並行リクエスト間でも一意）"""
+        return f"{prefix}_{next(self.request_counter)}_{uuid.uuid4().hex[:8]}"
+
+    async def _generate_with_cache(
+        self,
+        prompt: str,
+        request: Optional[AIRequest],
+        provider: AIProvider
+    ) -> AIResponse:
+        """
+        キャッシュを介した生成
+        
+        同一プロバイダー・同一プロンプトの成功応答は再利用し、AI呼び出しを省略する。
+        実行中の同一生成がある場合は新たに呼び出さず、その結果を共有する。
+        キャッシュや実行中の生成から返す応答はプロバイダー呼び出しを伴わないため、コスト・使用量を計上しない
+        """
+        cache_key = self._response_cache_key(prompt, provider, request)
+        cached_response = self.response_cache.get(cache_key)
+        if cached_response is not None:
+            self.response_cache.move_to_end(cache_key)
+            return self._reused_response(cached_response)
+        
+        task = self.inflight_generations.get(cache_key)
+        is_owner = task is None
+        if is_owner:
+            task = asyncio.create_task(
+                self._generate_and_store(cache_key, prompt, request, provider)
+            )
+            self.inflight_generations[cache_key] = task
+            task.add_done_callback(
+                lambda _: self.inflight_generations.pop(cache_key, None)
+            )
+        
+        # 待機側のキャンセルが共有中の生成に波及しないよう保護し、結果は呼び出し側ごとに複製
+        response = await asyncio.shield(task)
+        if not is_owner:
+            return self._reused_response(response)
+        return copy.deepcopy(response)
+
+    async def _generate_and_store(
+        self,
+        cache_key: str,
+        prompt: str,
+        request: Optional[AIRequest],
+        provider: AIProvider
+    ) -> AIResponse:
+        """生成を実行し、成功応答をキャッシュに保存"""
+        if provider == AIProvider.HYBRID:
+            # 複数AIプロバイダーによる並列生成
+            response = await self._hybrid_generation(prompt, request)
+        else:
+            # 単一プロバイダー使用
+            response = await self._single_provider_generation(
+                prompt, request, provider
+            )
+        
+        if response.success:
+            self._store_response(cache_key, response)
+        return response
+
+    def _reused_response(self, response: AIResponse) -> AIResponse:
+        """キャッシュ・実行中の生成から再利用した応答の複製（コスト・使用量は生成時に計上済み）"""
+        reused = copy.deepcopy(response)
+        reused.cost = 0.0
+        reused.metadata['usage'] = {}
+        reused.metadata['cached'] = True
+        return reused
+
+    def _response_cache_key(
+        self,
+        prompt: str,
+        provider: AIProvider,
+        request: Optional[AIRequest] = None
+    ) -> str:
+        """
+        生成結果キャッシュキー生成（プロバイダーとプロンプトのハッシュ）
+        
+        ハイブリッド生成は応答の選び方（最初の成功・全応答比較）で結果が変わるため
+        quality_gate の指定を、生成内容が変わる temperature の指定もキーに含める
+        """
+        options = (request.options or {}) if request else {}
+        mode = provider.value
+        if provider == AIProvider.HYBRID and options.get('quality_gate'):
+            mode = f"{mode}+quality_gate"
+        if options.get('temperature') is not None:
+            mode = f"{mode}+temperature={options['temperature']}"
+        return hashlib.blake2b(
+            f"{mode}|{prompt}".encode(), digest_size=16
+        ).hexdigest()
+
+    def _store_response(self, cache_key: str, response: AIResponse) -> None:
+        """生成結果をキャッシュに保存（呼び出し側での変更が波及しないよう複製を保持）"""
+        self.response_cache[cache_key] = copy.deepcopy(response)
+        self.response_cache.move_to_end(cache_key)
+        
+        while len(self.response_cache) > AI_RESPONSE_CACHE_SIZE:
+            self.response_cache.popitem(last=False)
+
     async def _hybrid_generation(
         self, 
         prompt: str, 
@@ -274,44 +708,76 @@ class EnhancedAIService:
     ) -> AIResponse:
         """
         ハイブリッド生成（複数AI並列実行）
+        
+        既定では最初に成功した応答を採用し、残りのリクエストはキャンセルする。
+        options['quality_gate'] が True の場合のみ全プロバイダーの応答を待って比較する
+        （generate_business_plan の quality_gate 引数で指定）。
         """
+        options = request.options or {}
+        temperature = options.get('temperature')
         tasks = [
-            self._openai_request(prompt),
-            self._anthropic_request(prompt)
+            asyncio.create_task(self._openai_request(prompt, temperature=temperature)),
+            asyncio.create_task(self._anthropic_request(prompt, temperature=temperature))
         ]
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # 最良の結果を選択
-        best_response = self._select_best_response(results)
+        if options.get('quality_gate'):
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            
+            # 最良の結果を選択
+            best_response = self._select_best_response(results)
+            providers_used = ['openai', 'anthropic']
+        else:
+            best_response = await self._first_successful_response(tasks)
+            # 残りのリクエストはキャンセル済みのため、採用した応答のプロバイダーのみ記録
+            providers_used = [best_response.provider] if best_response.provider else []
         
         # ハイブリッド結果のメタデータ追加
         best_response.metadata['generation_method'] = 'hybrid'
-        best_response.metadata['providers_used'] = ['openai', 'anthropic']
+        best_response.metadata['providers_used'] = providers_used
         
         return best_response
 
+    async def _first_successful_response(self, tasks: List[asyncio.Task]) -> AIResponse:
+        """最初に成功した応答を返し、未完了のリクエストをキャンセル"""
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None and task.result().success:
+                        return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        return self._select_best_response([])
+
     async def _single_provider_generation(
         self,
         prompt: str,
-        request: AIRequest,
+        request: Optional[AIRequest],
         provider: AIProvider
     ) -> AIResponse:
-        """単一プロバイダー生成"""
+        """単一プロバイダー生成（request.options の temperature を反映）"""
+        temperature = ((request.options or {}) if request else {}).get('temperature')
         if provider == AIProvider.OPENAI:
-            return await self._openai_request(prompt)
+            return await self._openai_request(prompt, temperature=temperature)
         elif provider == AIProvider.ANTHROPIC:
-            return await self._anthropic_request(prompt)
+            return await self._anthropic_request(prompt, temperature=temperature)
         else:
             raise ValueError(f"Unsupported provider: {provider}")
 
-    async def _openai_request(self, prompt: str) -> AIResponse:
-        """OpenAI API リクエスト"""
+    async def _openai_request(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None
+    ) -> AIResponse:
+        """OpenAI API リクエスト（temperature 未指定時はプロバイダー設定値）"""
         try:
-            response = await asyncio.wait_for(
-                self._make_openai_call(prompt),
-                timeout=self.provider_config[AIProvider.OPENAI]['timeout']
-            )
+            async with self.provider_semaphores[AIProvider.OPENAI]:
+                response = await self._make_openai_call(prompt, temperature=temperature)
             
             return AIResponse(
                 request_id="",
@@ -320,24 +786,30 @@ class EnhancedAIService:
                 provider="openai",
                 metadata={
                     'model': response.model,
-                    'usage': response.usage._asdict() if response.usage else {},
+                    'usage': response.usage.model_dump() if response.usage else {},
                     'finish_reason': response.choices[0].finish_reason
                 },
                 cost=self._calculate_openai_cost(response.usage)
             )
             
-        except asyncio.TimeoutError:
+        except openai.APITimeoutError:
             raise Exception("OpenAI APIタイムアウト")
         except Exception as e:
             raise Exception(f"OpenAI APIエラー: {str(e)}")
 
-    async def _anthropic_request(self, prompt: str) -> AIResponse:
-        """Anthropic API リクエスト"""
+    async def _anthropic_request(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        timeout: Optional[float] = None,
+        temperature: Optional[float] = None
+    ) -> AIResponse:
+        """Anthropic API リクエスト（max_tokens・timeout・temperature 未指定時はプロバイダー設定値）"""
         try:
-            response = await asyncio.wait_for(
-                self._make_anthropic_call(prompt),
-                timeout=self.provider_config[AIProvider.ANTHROPIC]['timeout']
-            )
+            async with self.provider_semaphores[AIProvider.ANTHROPIC]:
+                response = await self._make_anthropic_call(
+                    prompt, max_tokens=max_tokens, timeout=timeout, temperature=temperature
+                )
             
             return AIResponse(
                 request_id="",
@@ -355,12 +827,12 @@ class EnhancedAIService:
                 cost=self._calculate_anthropic_cost(response.usage)
             )
             
-        except asyncio.TimeoutError:
+        except AnthropicTimeoutError:
             raise Exception("Anthropic APIタイムアウト")
         except Exception as e:
             raise Exception(f"Anthropic APIエラー: {str(e)}")
 
-    async def _make_openai_call(self, prompt: str):
+    async def _make_openai_call(self, prompt: str, temperature: Optional[float] = None):
         """OpenAI API 実際の呼び出し"""
         config = self.provider_config[AIProvider.OPENAI]
         
@@ -377,25 +849,33 @@ class EnhancedAIService:
                 }
             ],
             max_tokens=config['max_tokens'],
-            temperature=config['temperature']
+            temperature=config['temperature'] if temperature is None else temperature,
+            timeout=config['timeout']
         )
         
         return response
 
-    async def _make_anthropic_call(self, prompt: str):
+    async def _make_anthropic_call(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        timeout: Optional[float] = None,
+        temperature: Optional[float] = None
+    ):
         """Anthropic API 実際の呼び出し"""
         config = self.provider_config[AIProvider.ANTHROPIC]
         
         response = await self.anthropic_client.messages.create(
             model=config['model'],
-            max_tokens=config['max_tokens'],
-            temperature=config['temperature'],
+            max_tokens=max_tokens or config['max_tokens'],
+            temperature=config['temperature'] if temperature is None else temperature,
             messages=[
                 {
                     "role": "user",
                     "content": prompt
                 }
-            ]
+            ],
+            timeout=timeout or config['timeout']
         )
         
         return response
@@ -411,8 +891,14 @@ class EnhancedAIService:
                 error="全てのAIプロバイダーが失敗しました"
             )
         
-        # 品質スコアに基づいて選択（簡易版）
-        best_response = max(valid_responses, key=lambda r: len(r.content or ""))
+        if len(valid_responses) == 1:
+            return valid_responses[0]
+        
+        # 指示どおりJSONとして解釈できる応答を優先し、同条件なら内容の長い応答を選択（簡易版）
+        best_response = max(
+            valid_responses,
+            key=lambda r: (self._parse_json_content(r.content) is not None, len(r.content or ""))
+        )
         return best_response
 
     def _build_business_plan_prompt(
@@ -464,13 +950,13 @@ JSON形式で回答してください。
 以下の補助金申請の採択可能性を分析してください。
 
 ## 申請データ
-{json.dumps(application_data, ensure_ascii=False, indent=2)}
+{_dumps_for_prompt(application_data)}
 
 ## 補助金プログラム
-{json.dumps(subsidy_program, ensure_ascii=False, indent=2)}
+{_dumps_for_prompt(subsidy_program)}
 
 ## 抽出特徴量
-{json.dumps(features, ensure_ascii=False, indent=2)}
+{_dumps_for_prompt(features)}
 
 以下の形式で分析結果を返してください：
 
@@ -489,6 +975,56 @@ JSON形式で回答してください。
   "success_factors": ["成功要因1", "成功要因2"],
   "risk_factors": ["リスク要因1", "リスク要因2"]
 }}
+"""
+
+    def _build_batch_adoption_prediction_prompt(
+        self,
+        applications: List[Dict],
+        subsidy_program: Dict,
+        features_list: List[Dict]
+    ) -> str:
+        """採択可能性一括予測プロンプト構築"""
+        application_sections = "\n".join(
+            f"""
+### 申請 {index}
+#### 申請データ
+{_dumps_for_prompt(application_data)}
+
+#### 抽出特徴量
+{_dumps_for_prompt(features)}
+"""
+            for index, (application_data, features) in enumerate(zip(applications, features_list))
+        )
+        
+        return f"""
+以下の補助金申請{len(applications)}件の採択可能性をそれぞれ分析してください。
+
+## 補助金プログラム
+{_dumps_for_prompt(subsidy_program)}
+
+## 申請一覧
+{application_sections}
+
+申請ごとに以下の形式のオブジェクトを作成し、JSON配列で返してください（idは申請番号）：
+
+[
+  {{
+    "id": 0,
+    "adoption_probability": 0.75,
+    "confidence_score": 0.85,
+    "score_breakdown": {{
+      "innovation_score": 80,
+      "feasibility_score": 75,
+      "market_potential_score": 85,
+      "budget_adequacy_score": 70
+    }},
+    "key_strengths": ["強み1", "強み2", "強み3"],
+    "key_weaknesses": ["弱み1", "弱み2"],
+    "improvement_suggestions": ["改善提案1", "改善提案2", "改善提案3"],
+    "success_factors": ["成功要因1", "成功要因2"],
+    "risk_factors": ["リスク要因1", "リスク要因2"]
+  }}
+]
 """
 
     def _build_document_analysis_prompt(
@@ -541,27 +1077,66 @@ JSON形式で回答してください。
         # 簡易実装
         return ["AI活用", "デジタル化", "効率向上"]
 
+    def _parse_json_content(self, content: Optional[str]) -> Any:
+        """
+        AI応答からのJSON抽出
+        
+        応答全体、コードブロック内、最初の括弧から最後の括弧までの順に試し、
+        いずれもパースできなければNoneを返す
+        """
+        if not content:
+            return None
+        
+        candidates = [content]
+        fence = _JSON_FENCE_RE.search(content)
+        if fence:
+            candidates.append(fence.group(1))
+        for open_char, close_char in (('{', '}'), ('[', ']')):
+            start = content.find(open_char)
+            end = content.rfind(close_char)
+            if 0 <= start < end:
+                candidates.append(content[start:end + 1])
+        
+        for candidate in candidates:
+            try:
+                return _loads_json(candidate)
+            except ValueError:
+                continue
+        return None
+
     def _parse_prediction_result(self, content: str) -> Dict:
         """予測結果パース"""
-        try:
-            return json.loads(content)
-        except:
-            return {
-                "adoption_probability": 0.7,
-                "confidence_score": 0.6,
-                "error": "パース失敗"
+        result = self._parse_json_content(content)
+        if isinstance(result, dict):
+            return result
+        return {
+            "adoption_probability": 0.7,
+            "confidence_score": 0.6,
+            "error": "パース失敗"
+        }
+
+    def _parse_batch_prediction_result(self, content: str, count: int) -> List[Optional[Dict]]:
+        """一括予測結果パース（申請番号順、結果を得られなかった申請はNone）"""
+        parsed = self._parse_json_content(content)
+        
+        results_by_id = {}
+        if isinstance(parsed, list):
+            results_by_id = {
+                str(item.get('id')): item for item in parsed if isinstance(item, dict)
             }
+        
+        return [results_by_id.get(str(index)) for index in range(count)]
 
     def _parse_document_analysis(self, content: str) -> Dict:
         """文書解析結果パース"""
-        try:
-            return json.loads(content)
-        except:
-            return {
-                "summary": "解析失敗",
-                "quality_score": 60,
-                "error": "パース失敗"
-            }
+        result = self._parse_json_content(content)
+        if isinstance(result, dict):
+            return result
+        return {
+            "summary": "解析失敗",
+            "quality_score": 60,
+            "error": "パース失敗"
+        }
 
     def _calculate_openai_cost(self, usage) -> float:
         """OpenAI コスト計算"""
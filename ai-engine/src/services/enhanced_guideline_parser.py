@@ -3,19 +3,66 @@
 補助金募集要項・ガイドラインの高精度解析・構造化機能
 """
 
-from typing import Dict, List, Optional, Any, Tuple, Union
+from typing import Dict, List, Optional, Any, Set, Tuple, Union
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, date
 from enum import Enum
+from functools import lru_cache
+from collections import OrderedDict
 import asyncio
+import copy
 import logging
 import json
 import re
+import threading
 from urllib.parse import urlparse
 import hashlib
 
+# テンプレート判定キーワードの一括検出（任意）
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# 解析結果キャッシュの最大保持件数
+GUIDELINE_PARSING_CACHE_SIZE = 256
+
+# セクション抽出結果キャッシュの最大保持件数
+GUIDELINE_SECTION_CACHE_SIZE = 512
+
+# フィールド抽出パターンのフラグ
+_FIELD_PATTERN_FLAGS = re.MULTILINE | re.IGNORECASE
+
+# セクション終端（次のセクション見出し）パターン
+_NEXT_SECTION_PATTERNS = [
+    re.compile(r'\n\s*\d+\.'),  # 番号付きセクション
+    re.compile(r'\n[■●◆▲]'),   # 記号付きセクション
+    re.compile(r'\n【.*?】')    # 括弧付きセクション
+]
+
+# リスト抽出時のセクション終端パターン
+_LIST_NEXT_SECTION_RE = re.compile(r'\n\s*\d+\.|\n[■●]')
+
+# リスト項目パターン（番号付き・記号付き・ハイフン付きを1回の走査で抽出）
+# 空白は改行を含まない（[^\S\n]）ものに限定し、ページ番号などの数字だけの行が次の行の項目を取り込まないようにする
+_LIST_ITEM_RE = re.compile(
+    r'^[^\S\n]*(?:\d+[.)]?[^\S\n]+|[・･•◦▪▫][^\S\n]*|[-−][^\S\n]*)(.+)$', re.MULTILINE
+)
+
+
+@lru_cache(maxsize=None)
+def _heading_patterns(keyword: str) -> Tuple[re.Pattern, ...]:
+    """セクション見出しパターン（キーワードごとに1回だけコンパイル）"""
+    escaped = re.escape(keyword)
+    return (
+        re.compile(rf"^\s*\d*\.?\s*{escaped}.*?$", _FIELD_PATTERN_FLAGS),
+        re.compile(rf"^[■●◆▲]\s*{escaped}.*?$", _FIELD_PATTERN_FLAGS),
+        re.compile(rf"^【{escaped}】.*?$", _FIELD_PATTERN_FLAGS)
+    )
+
 
 class SourceType(Enum):
     """ソースタイプ"""
@@ -52,7 +99,7 @@ class FieldType(Enum):
     STRUCTURED = "structured"
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedField:
     """抽出フィールド"""
     field_name: str
@@ -65,7 +112,7 @@ class ExtractedField:
     alternatives: List[Any] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentStructure:
     """文書構造"""
     sections: Dict[DocumentSection, Dict[str, Any]]
@@ -75,7 +122,7 @@ class DocumentStructure:
     language: str = "ja"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationRule:
     """検証ルール"""
     field_name: str
@@ -84,7 +131,7 @@ class ValidationRule:
     error_message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsingResult:
     """解析結果"""
     document_id: str
@@ -97,7 +144,7 @@ class ParsingResult:
     actionable_items: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class UniversalTemplate:
     """汎用テンプレート"""
     template_id: str
@@ -114,10 +161,20 @@ class EnhancedGuidelineParser:
     
     def __init__(self):
         self.universal_templates = {}
-        self.parsing_cache = {}
+        # 解析結果キャッシュ（ソース・抽出テキスト・解析条件のハッシュ → 解析結果、LRU）
+        self.parsing_cache: OrderedDict[str, ParsingResult] = OrderedDict()
+        # セクション抽出結果キャッシュ（テキストのハッシュ・セクション種別・見出しパターン → 抽出結果、LRU）
+        # 構造解析はワーカースレッドで実行されるため、更新はロックで保護する
+        self.section_cache: OrderedDict[Tuple[str, Any, Tuple[str, ...]], Optional[Dict[str, Any]]] = OrderedDict()
+        self._section_cache_lock = threading.Lock()
         self.ai_service = None
         self.ocr_service = None
         self._initialize_universal_templates()
+        # テンプレート判定キーワード（小文字化済み → テンプレートID別の加点）
+        self.template_keyword_weights = self._build_template_keyword_weights()
+        self.template_keyword_automaton = self._build_template_keyword_automaton(
+            self.template_keyword_weights
+        )
     
     
     def _initialize_universal_templates(self):
@@ -322,6 +379,56 @@ class EnhancedGuidelineParser:
             "monodukuri_universal": monodukuri_template,
             "it_universal": it_template
         }
+        
+        for template in self.universal_templates.values():
+            self._compile_template(template)
+    
+    
+    def _compile_template(self, template: UniversalTemplate):
+        """テンプレートの抽出パターンを事前コンパイル"""
+        
+        for field_def in template.field_definitions:
+            field_def["compiled_patterns"] = [
+                re.compile(pattern, _FIELD_PATTERN_FLAGS) for pattern in field_def["patterns"]
+            ]
+    
+    
+    def _build_template_keyword_weights(self) -> Dict[str, Dict[str, int]]:
+        """テンプレート判定用キーワードと加点の対応表を構築"""
+        
+        keyword_weights: Dict[str, Dict[str, int]] = {}
+        for template_id, template in self.universal_templates.items():
+            weighted_keywords = [(subsidy_type, 10) for subsidy_type in template.subsidy_types]
+            weighted_keywords.extend(
+                (pattern, 1)
+                for patterns in template.section_patterns.values()
+                for pattern in patterns
+            )
+            for keyword, weight in weighted_keywords:
+                template_weights = keyword_weights.setdefault(keyword.lower(), {})
+                template_weights[template_id] = template_weights.get(template_id, 0) + weight
+        
+        return keyword_weights
+    
+    
+    def _build_template_keyword_automaton(self, keyword_weights: Dict[str, Dict[str, int]]):
+        """テンプレート判定用Aho-Corasickオートマトン構築（ライブラリ未導入時はNone）"""
+        if not AHOCORASICK_AVAILABLE or not keyword_weights:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for keyword in keyword_weights:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+    
+    
+    def _find_template_keywords(self, text_lower: str) -> Set[str]:
+        """テキスト中に出現するテンプレート判定キーワードを抽出（重なり合う出現も含めて検出）"""
+        if self.template_keyword_automaton is None:
+            return {keyword for keyword in self.template_keyword_weights if keyword in text_lower}
+        
+        return {keyword for _, keyword in self.template_keyword_automaton.iter(text_lower)}
     
     
     async def parse_guideline_document(
@@ -335,16 +442,21 @@ class EnhancedGuidelineParser:
         
         document_id = self._generate_document_id(source)
         
-        # キャッシュチェック
-        if document_id in self.parsing_cache:
-            logger.info(f"キャッシュから結果を返却: {document_id}")
-            return self.parsing_cache[document_id]
-        
-        logger.info(f"募集要項解析開始: {source} ({source_type.value})")
-        
         # テキスト抽出
         raw_text = await self._extract_text_from_source(source, source_type)
         
+        # キャッシュチェック（抽出したテキスト内容と解析条件が同一なら再解析しない）
+        cache_key = self._parsing_cache_key(
+            source, source_type, raw_text, template_hint, custom_fields
+        )
+        cached_result = self.parsing_cache.get(cache_key)
+        if cached_result is not None:
+            self.parsing_cache.move_to_end(cache_key)
+            logger.info(f"キャッシュから結果を返却: {cached_result.document_id}")
+            return copy.deepcopy(cached_result)
+        
+        logger.info(f"募集要項解析開始: {source} ({source_type.value})")
+        
         # テンプレート自動選択
         selected_template = await self._auto_select_template(raw_text, template_hint)
         
@@ -398,7 +510,7 @@ class EnhancedGuidelineParser:
         )
         
         # キャッシュに保存
-        self.parsing_cache[document_id] = result
+        self._store_parsing_result(cache_key, result)
         
         logger.info(f"募集要項解析完了: {document_id} - 信頼度: {document_structure.parsing_confidence:.1f}%")
         return result
@@ -407,11 +519,42 @@ class EnhancedGuidelineParser:
     def _generate_document_id(self, source: str) -> str:
         """文書IDの生成"""
         
-        source_hash = hashlib.md5(source.encode()).hexdigest()[:8]
+        source_hash = hashlib.blake2b(source.encode(), digest_size=4).hexdigest()
         timestamp = datetime.now().strftime("%Y%m%d_%H%M")
         return f"guideline_{timestamp}_{source_hash}"
     
     
+    def _parsing_cache_key(
+        self,
+        source: str,
+        source_type: SourceType,
+        raw_text: str,
+        template_hint: Optional[str],
+        custom_fields: Optional[List[Dict[str, Any]]]
+    ) -> str:
+        """解析結果キャッシュキーの生成"""
+        
+        conditions = json.dumps(
+            [source_type.value, template_hint, custom_fields],
+            ensure_ascii=False, sort_keys=True, default=str
+        )
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (conditions, source, raw_text):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+    
+    
+    def _store_parsing_result(self, cache_key: str, result: ParsingResult):
+        """解析結果をキャッシュに保存（呼び出し側での変更が波及しないよう複製を保持）"""
+        
+        self.parsing_cache[cache_key] = copy.deepcopy(result)
+        self.parsing_cache.move_to_end(cache_key)
+        
+        while len(self.parsing_cache) > GUIDELINE_PARSING_CACHE_SIZE:
+            self.parsing_cache.popitem(last=False)
+    
+    
     async def _extract_text_from_source(
         self,
         source: str,
@@ -518,23 +661,12 @@ class EnhancedGuidelineParser:
         if template_hint and template_hint in self.universal_templates:
             return self.universal_templates[template_hint]
         
-        # キーワードベースの自動判定
-        text_lower = text.lower()
-        
-        scores = {}
-        for template_id, template in self.universal_templates.items():
-            score = 0
-            for subsidy_type in template.subsidy_types:
-                if subsidy_type.lower() in text_lower:
-                    score += 10
-            
-            # セクションパターンのマッチング
-            for section, patterns in template.section_patterns.items():
-                for pattern in patterns:
-                    if pattern.lower() in text_lower:
-                        score += 1
-            
-            scores[template_id] = score
+        # キーワードベースの自動判定（補助金名は10点、セクション見出しは1点。
+        # 各キーワードは出現の有無のみを数え、全テンプレート分を1回の走査で検出する）
+        scores = dict.fromkeys(self.universal_templates, 0)
+        for keyword in self._find_template_keywords(text.lower()):
+            for template_id, weight in self.template_keyword_weights[keyword].items():
+                scores[template_id] += weight
         
         # 最高スコアのテンプレートを選択
         if scores:
@@ -555,28 +687,45 @@ class EnhancedGuidelineParser:
     ) -> DocumentStructure:
         """文書構造解析"""
         
+        # 正規表現によるセクション・フィールド走査はCPU処理のため、
+        # ワーカースレッドで実行してイベントループを塞がないようにする
+        return await asyncio.to_thread(
+            self._analyze_document_structure_sync, text, template, custom_fields
+        )
+    
+    
+    def _analyze_document_structure_sync(
+        self,
+        text: str,
+        template: Optional[UniversalTemplate],
+        custom_fields: Optional[List[Dict[str, Any]]]
+    ) -> DocumentStructure:
+        """文書構造解析（同期処理本体）"""
+        
         sections = {}
         confidence_scores = []
+        # テンプレートやカスタムフィールドを変えた再解析でもセクション抽出を再利用するためのキー
+        text_hash = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
         
         # セクション抽出
         if template:
             for section_type, patterns in template.section_patterns.items():
-                section_content = await self._extract_section_content(
-                    text, patterns, section_type
+                section_content = self._cached_section_content(
+                    text, text_hash, patterns, section_type
                 )
                 if section_content:
                     sections[section_type] = section_content
                     confidence_scores.append(section_content.get("confidence", 0.5))
         else:
             # 汎用セクション抽出
-            sections = await self._extract_generic_sections(text)
+            sections = self._extract_generic_sections(text, text_hash)
             confidence_scores = [0.6] * len(sections)
         
         # フィールド抽出（プレリミナリー）
         extracted_fields = []
         if template:
             for field_def in template.field_definitions:
-                field_result = await self._extract_single_field(text, field_def)
+                field_result = self._extract_single_field(text, field_def)
                 if field_result:
                     extracted_fields.append(field_result)
                     confidence_scores.append(field_result.confidence)
@@ -584,7 +733,7 @@ class EnhancedGuidelineParser:
         # カスタムフィールド処理
         if custom_fields:
             for custom_field in custom_fields:
-                field_result = await self._extract_custom_field(text, custom_field)
+                field_result = self._extract_custom_field(text, custom_field)
                 if field_result:
                     extracted_fields.append(field_result)
                     confidence_scores.append(field_result.confidence)
@@ -611,7 +760,33 @@ class EnhancedGuidelineParser:
         )
     
     
-    async def _extract_section_content(
+    def _cached_section_content(
+        self,
+        text: str,
+        text_hash: str,
+        patterns: List[str],
+        section_type: DocumentSection
+    ) -> Optional[Dict[str, Any]]:
+        """セクションコンテンツ抽出（同一テキスト・同一パターンの結果はキャッシュから返す）"""
+        
+        cache_key = (text_hash, section_type, tuple(patterns))
+        with self._section_cache_lock:
+            if cache_key in self.section_cache:
+                self.section_cache.move_to_end(cache_key)
+                return copy.copy(self.section_cache[cache_key])
+        
+        section_content = self._extract_section_content(text, patterns, section_type)
+        
+        with self._section_cache_lock:
+            self.section_cache[cache_key] = copy.copy(section_content)
+            self.section_cache.move_to_end(cache_key)
+            while len(self.section_cache) > GUIDELINE_SECTION_CACHE_SIZE:
+                self.section_cache.popitem(last=False)
+        
+        return section_content
+    
+    
+    def _extract_section_content(
         self,
         text: str,
         patterns: List[str],
@@ -620,42 +795,35 @@ class EnhancedGuidelineParser:
         """セクションコンテンツ抽出"""
         
         for pattern in patterns:
-            # パターンマッチング
-            matches = []
+            # 見出しにはキーワード自体が含まれるため、大文字・小文字の区別がない
+            # キーワードは本文に現れない限り見出しパターンの走査を省略する
+            if pattern.lower() == pattern.upper() and pattern not in text:
+                continue
             
-            # 見出しパターン検索
-            heading_patterns = [
-                rf"^\s*\d*\.?\s*{re.escape(pattern)}.*?$",
-                rf"^[■●◆▲]\s*{re.escape(pattern)}.*?$",
-                rf"^【{re.escape(pattern)}】.*?$"
-            ]
+            # 見出しパターン検索（優先度の高いパターンの最初のマッチのみ使用）
+            heading_match = None
+            for heading_pattern in _heading_patterns(pattern):
+                heading_match = heading_pattern.search(text)
+                if heading_match:
+                    break
             
-            for heading_pattern in heading_patterns:
-                matches.extend(re.finditer(heading_pattern, text, re.MULTILINE | re.IGNORECASE))
-            
-            if matches:
+            if heading_match:
                 # 最初のマッチから次のセクションまでの内容を抽出
-                start_pos = matches[0].end()
-                
-                # 次のセクション開始位置を探索
-                next_section_patterns = [
-                    r'\n\s*\d+\.',  # 番号付きセクション
-                    r'\n[■●◆▲]',   # 記号付きセクション
-                    r'\n【.*?】'    # 括弧付きセクション
-                ]
+                start_pos = heading_match.end()
                 
+                # 次のセクション開始位置を探索（テキストを切り出さずに位置指定で検索）
                 end_pos = len(text)
-                for next_pattern in next_section_patterns:
-                    next_match = re.search(next_pattern, text[start_pos:])
+                for next_pattern in _NEXT_SECTION_PATTERNS:
+                    next_match = next_pattern.search(text, start_pos)
                     if next_match:
-                        end_pos = start_pos + next_match.start()
+                        end_pos = next_match.start()
                         break
                 
                 content = text[start_pos:end_pos].strip()
                 
                 if content:
                     return {
-                        "title": matches[0].group().strip(),
+                        "title": heading_match.group().strip(),
                         "content": content,
                         "start_position": start_pos,
                         "end_position": end_pos,
@@ -666,7 +834,11 @@ class EnhancedGuidelineParser:
         return None
     
     
-    async def _extract_generic_sections(self, text: str) -> Dict[DocumentSection, Dict[str, Any]]:
+    def _extract_generic_sections(
+        self,
+        text: str,
+        text_hash: str
+    ) -> Dict[DocumentSection, Dict[str, Any]]:
         """汎用セクション抽出"""
         
         sections = {}
@@ -682,14 +854,14 @@ class EnhancedGuidelineParser:
         }
         
         for section_type, patterns in generic_patterns.items():
-            section_content = await self._extract_section_content(text, patterns, section_type)
+            section_content = self._cached_section_content(text, text_hash, patterns, section_type)
             if section_content:
                 sections[section_type] = section_content
         
         return sections
     
     
-    async def _extract_single_field(
+    def _extract_single_field(
         self,
         text: str,
         field_def: Dict[str, Any]
@@ -698,13 +870,16 @@ class EnhancedGuidelineParser:
         
         field_name = field_def["field_name"]
         field_type = FieldType(field_def["field_type"])
-        patterns = field_def["patterns"]
+        patterns = field_def.get("compiled_patterns") or [
+            re.compile(pattern, _FIELD_PATTERN_FLAGS) for pattern in field_def["patterns"]
+        ]
         
         best_match = None
+        best_value = None
         best_confidence = 0.0
         
         for pattern in patterns:
-            matches = re.finditer(pattern, text, re.MULTILINE | re.IGNORECASE)
+            matches = pattern.finditer(text)
             
             for match in matches:
                 extracted_value = None
@@ -723,13 +898,20 @@ class EnhancedGuidelineParser:
                 
                 if extracted_value and confidence > best_confidence:
                     best_match = match
+                    best_value = extracted_value
                     best_confidence = confidence
+                    # パターン由来の信頼度は一律のため、最初に値が得られたマッチで確定する
+                    if best_confidence >= 0.7:
+                        break
+            
+            if best_confidence >= 0.7:
+                break
         
         if best_match and best_confidence > 0.5:
             return ExtractedField(
                 field_name=field_name,
                 field_type=field_type,
-                value=extracted_value,
+                value=best_value,
                 confidence=best_confidence,
                 source_text=best_match.group(0),
                 position={"start": best_match.start(), "end": best_match.end()}
@@ -796,31 +978,19 @@ class EnhancedGuidelineParser:
         end_pos = len(full_text)
         
         # 次のセクション開始を探索
-        next_section = re.search(r'\n\s*\d+\.|\n[■●]', full_text[start_pos:])
+        next_section = _LIST_NEXT_SECTION_RE.search(full_text, start_pos)
         if next_section:
-            end_pos = start_pos + next_section.start()
+            end_pos = next_section.start()
         
         content = full_text[start_pos:end_pos].strip()
         
-        # リスト項目抽出
-        list_items = []
-        
-        # 番号付きリスト
-        numbered_items = re.findall(r'^\s*\d+[.)]?\s+(.+)$', content, re.MULTILINE)
-        list_items.extend(numbered_items)
-        
-        # 記号付きリスト
-        bullet_items = re.findall(r'^\s*[・･•◦▪▫]\s*(.+)$', content, re.MULTILINE)
-        list_items.extend(bullet_items)
-        
-        # ハイフン付きリスト
-        dash_items = re.findall(r'^\s*[-−]\s*(.+)$', content, re.MULTILINE)
-        list_items.extend(dash_items)
+        # リスト項目抽出（番号付き・記号付き・ハイフン付きを文書中の出現順に取得）
+        list_items = _LIST_ITEM_RE.findall(content)
         
         return [item.strip() for item in list_items if item.strip()]
     
     
-    async def _extract_custom_field(
+    def _extract_custom_field(
         self,
         text: str,
         custom_field: Dict[str, Any]
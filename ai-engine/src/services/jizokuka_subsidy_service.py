@@ -130,9 +130,10 @@ class JizokukaSubsidyService:
     
     def __init__(self, output_dir: str = "output/jizokuka"):
         """初期化"""
+        # AIサービス（接続プール）は配下のサービスと共有し、aclose() でまとめて閉じる
         self.ai_service = EnhancedAIService()
-        self.application_writer = ApplicationWriter()
-        self.document_proofreader = DocumentProofreader()
+        self.application_writer = ApplicationWriter(self.ai_service)
+        self.document_proofreader = DocumentProofreader(self.ai_service)
         self.quality_evaluator = QualityEvaluator()
         self.template_manager = ApplicationTemplateManager()
         
@@ -144,6 +145,10 @@ class JizokukaSubsidyService:
         
         logger.info("持続化補助金サービス初期化完了")
     
+    async def aclose(self):
+        """共有しているAIサービスの接続プールを閉じる（アプリケーション終了時に呼び出す）"""
+        await self.ai_service.aclose()
+    
     async def create_complete_application(
         self,
         company_info: JizokukaCompanyInfo,
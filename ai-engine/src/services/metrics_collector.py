@@ -10,6 +10,7 @@ import json
 import asyncio
 import logging
 from collections import defaultdict, deque
+from itertools import islice
 import statistics
 
 logger = logging.getLogger(__name__)
@@ -436,13 +437,13 @@ class MetricsCollector:
             
             # 直近の平均応答時間
             recent_times = [
-                m.processing_time for m in list(self.metrics_history)[-10:]
+                m.processing_time for m in self._recent_metrics(10)
                 if m.processing_time > 0
             ]
             avg_response_time = statistics.mean(recent_times) if recent_times else 0
             
             # 直近のエラー率
-            recent_requests = list(self.metrics_history)[-50:]
+            recent_requests = self._recent_metrics(50)
             recent_error_rate = len([
                 m for m in recent_requests if not m.success
             ]) / len(recent_requests) if recent_requests else 0
@@ -461,7 +462,7 @@ class MetricsCollector:
                 "error_rate": round(recent_error_rate, 3),
                 "health_status": health_status,
                 "active_providers": list(set(
-                    m.provider for m in list(self.metrics_history)[-10:]
+                    m.provider for m in self._recent_metrics(10)
                 )),
                 "total_metrics_recorded": len(self.metrics_history),
                 "alerts_count": len(self.alerts)
@@ -504,7 +505,7 @@ class MetricsCollector:
             alerts_triggered = []
             
             # エラー率チェック
-            recent_requests = list(self.metrics_history)[-20:]
+            recent_requests = self._recent_metrics(20)
             if len(recent_requests) >= 10:
                 error_rate = len([m for m in recent_requests if not m.success]) / len(recent_requests)
                 if error_rate > self.alert_thresholds['error_rate']:
@@ -527,7 +528,7 @@ class MetricsCollector:
             # 品質スコア低下チェック
             if metrics.quality_score > 0:
                 recent_quality_scores = [
-                    m.quality_score for m in list(self.metrics_history)[-10:]
+                    m.quality_score for m in self._recent_metrics(10)
                     if m.quality_score > 0
                 ]
                 if len(recent_quality_scores) >= 5:
@@ -548,6 +549,12 @@ class MetricsCollector:
         except Exception as e:
             logger.error(f"アラートチェックエラー: {str(e)}")
 
+    def _recent_metrics(self, count: int) -> List[RequestMetrics]:
+        """直近のメトリクス取得（履歴全体を複製せず末尾から取り出し、古い順で返す）"""
+        recent = list(islice(reversed(self.metrics_history), count))
+        recent.reverse()
+        return recent
+
     def _empty_performance_stats(self) -> PerformanceStats:
         """空のパフォーマンス統計"""
         return PerformanceStats(
@@ -45,9 +45,10 @@ class GenerationOptions:
 class SectionGenerator:
     """セクション別文章生成器"""
     
-    def __init__(self):
-        """初期化"""
-        self.ai_service = EnhancedAIService()
+    def __init__(self, ai_service: Optional[EnhancedAIService] = None):
+        """初期化（ai_service を渡した場合は呼び出し側の接続プールを共有し、クローズも呼び出し側が行う）"""
+        self._owns_ai_service = ai_service is None
+        self.ai_service = ai_service or EnhancedAIService()
         self.quality_evaluator = QualityEvaluator()
         self.prompt_manager = PromptManager()
         
@@ -60,6 +61,11 @@ class SectionGenerator:
         # テンプレートデータベース
         self.templates = self._load_section_templates()
 
+    async def aclose(self):
+        """自身で生成したAIサービスの接続プールを閉じる"""
+        if self._owns_ai_service:
+            await self.ai_service.aclose()
+
     async def generate_company_overview(
         self,
         context: SectionContext,
@@ -120,10 +120,11 @@ class ApplicationWorkflow:
     def __init__(self):
         """初期化"""
         # コアサービス
+        # AIサービス（接続プール）は配下のサービスと共有し、aclose() でまとめて閉じる
         self.ai_service = EnhancedAIService()
-        self.application_writer = ApplicationWriter()
-        self.section_generator = SectionGenerator()
-        self.document_proofreader = DocumentProofreader()
+        self.application_writer = ApplicationWriter(self.ai_service)
+        self.section_generator = SectionGenerator(self.ai_service)
+        self.document_proofreader = DocumentProofreader(self.ai_service)
         self.quality_evaluator = QualityEvaluator()
         self.document_analyzer = DocumentAnalyzer()
         self.metrics_collector = MetricsCollector()
@@ -137,6 +138,10 @@ class ApplicationWorkflow:
         
         logger.info("申請書作成ワークフロー初期化完了")
 
+    async def aclose(self):
+        """共有しているAIサービスの接続プールを閉じる（アプリケーション終了時に呼び出す）"""
+        await self.ai_service.aclose()
+
     async def create_application(
         self,
         company_profile: Dict[str, Any],
@@ -0,0 +1,237 @@
+"""
+文書校正サービス 一括AI校正・AI校正キャッシュ・可読性一括向上テスト
+AIサービスはスタブを注入して実行（外部API通信なし）
+"""
+
+import pytest
+import json
+from unittest.mock import Mock, AsyncMock
+
+from src.services.application_writer import ApplicationSection
+from src.services.document_proofreader import DocumentProofreader, IssueType
+from src.services.enhanced_ai_service import EnhancedAIService
+
+
+OVERVIEW_TEXT = "弊社はIT企業です。AIを活用した業務効率化を支援しています。"
+SUMMARY_TEXT = "本事業では受発注業務をデジタル化し、作業時間を半減させます。"
+
+
+def make_ai_response(payload):
+    """AIサービス応答のスタブ"""
+    return Mock(success=True, content=json.dumps(payload, ensure_ascii=False))
+
+
+def batch_payload(section_issues):
+    """一括AI校正の応答（セクション名 → 指摘リスト）"""
+    return {
+        "sections": {
+            section.value: {"issues": issues} for section, issues in section_issues.items()
+        }
+    }
+
+
+@pytest.fixture
+def ai_service():
+    """generate_text をスタブ化したAIサービス（存在しないAPIの呼び出しは失敗させる）"""
+    service = Mock(spec=EnhancedAIService)
+    service.generate_text = AsyncMock(return_value=make_ai_response({"sections": {}}))
+    return service
+
+
+@pytest.fixture
+def proofreader(ai_service):
+    return DocumentProofreader(ai_service)
+
+
+class TestBatchAIProofreading:
+    """一括AI校正テスト"""
+
+    @pytest.mark.asyncio
+    async def test_issues_mapped_to_sections_in_one_request(self, proofreader, ai_service):
+        """全セクションを1回のリクエストで校正し、指摘をセクションごとに振り分ける"""
+        ai_service.generate_text.return_value = make_ai_response(batch_payload({
+            ApplicationSection.COMPANY_OVERVIEW: [
+                {"type": "grammar", "severity": "high", "original": "IT企業", "suggested": "IT関連企業"}
+            ],
+            ApplicationSection.PROJECT_SUMMARY: [
+                {"type": "style", "severity": "low", "original": "半減させます", "suggested": "半減します"}
+            ],
+        }))
+
+        results = await proofreader._ai_batch_proofread({
+            ApplicationSection.COMPANY_OVERVIEW: OVERVIEW_TEXT,
+            ApplicationSection.PROJECT_SUMMARY: SUMMARY_TEXT,
+        })
+
+        assert ai_service.generate_text.await_count == 1
+        overview_issues = results[ApplicationSection.COMPANY_OVERVIEW]
+        summary_issues = results[ApplicationSection.PROJECT_SUMMARY]
+        assert [i.original_text for i in overview_issues] == ["IT企業"]
+        assert overview_issues[0].issue_type == IssueType.GRAMMAR
+        assert overview_issues[0].location["start"] == OVERVIEW_TEXT.index("IT企業")
+        assert overview_issues[0].location["section"] == ApplicationSection.COMPANY_OVERVIEW.value
+        assert [i.original_text for i in summary_issues] == ["半減させます"]
+
+    @pytest.mark.asyncio
+    async def test_section_missing_from_response_has_no_issues(self, proofreader, ai_service):
+        """応答に含まれないセクションは指摘なしとして扱う"""
+        ai_service.generate_text.return_value = make_ai_response(batch_payload({
+            ApplicationSection.COMPANY_OVERVIEW: [
+                {"type": "grammar", "severity": "medium", "original": "IT企業", "suggested": "IT関連企業"}
+            ],
+        }))
+
+        results = await proofreader._ai_batch_proofread({
+            ApplicationSection.COMPANY_OVERVIEW: OVERVIEW_TEXT,
+            ApplicationSection.PROJECT_SUMMARY: SUMMARY_TEXT,
+        })
+
+        assert len(results[ApplicationSection.COMPANY_OVERVIEW]) == 1
+        assert results[ApplicationSection.PROJECT_SUMMARY] == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("template", [
+        "```json\n{}\n```",
+        "校正結果は以下の通りです。\n{}\n以上です。",
+        "結果:\n```\n{}\n```\n補足: 特になし",
+    ])
+    async def test_fenced_or_prose_wrapped_response_is_parsed(self, proofreader, ai_service, template):
+        """コードブロックや説明文で囲まれた応答からもJSONを取り出す"""
+        payload = json.dumps(batch_payload({
+            ApplicationSection.COMPANY_OVERVIEW: [
+                {"type": "grammar", "severity": "high", "original": "IT企業", "suggested": "IT関連企業"}
+            ],
+        }), ensure_ascii=False)
+        ai_service.generate_text.return_value = Mock(success=True, content=template.format(payload))
+
+        results = await proofreader._ai_batch_proofread({
+            ApplicationSection.COMPANY_OVERVIEW: OVERVIEW_TEXT,
+        })
+
+        assert [i.original_text for i in results[ApplicationSection.COMPANY_OVERVIEW]] == ["IT企業"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("response", [
+        Mock(success=True, content="JSONではない応答"),
+        Mock(success=True, content='["配列の応答"]'),
+        Mock(success=True, content='{"sections": ["配列"]}'),
+        Mock(success=True, content='{"issues": []}'),
+        Mock(success=False, content=None),
+    ])
+    async def test_unusable_response_falls_back_to_per_section(self, proofreader, ai_service, response):
+        """応答が使えない場合は結果を返さず（個別校正に戻る）、キャッシュもしない"""
+        ai_service.generate_text.return_value = response
+
+        results = await proofreader._ai_batch_proofread({
+            ApplicationSection.COMPANY_OVERVIEW: OVERVIEW_TEXT,
+        })
+
+        assert results == {}
+        assert len(proofreader.ai_proofreading_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_malformed_section_entry_falls_back_to_per_section(self, proofreader, ai_service):
+        """形式が不正なセクションだけを結果から除外する"""
+        ai_service.generate_text.return_value = make_ai_response({
+            "sections": {
+                ApplicationSection.COMPANY_OVERVIEW.value: "指摘なし",
+                ApplicationSection.PROJECT_SUMMARY.value: {"issues": []},
+            }
+        })
+
+        results = await proofreader._ai_batch_proofread({
+            ApplicationSection.COMPANY_OVERVIEW: OVERVIEW_TEXT,
+            ApplicationSection.PROJECT_SUMMARY: SUMMARY_TEXT,
+        })
+
+        assert results == {ApplicationSection.PROJECT_SUMMARY: []}
+
+    @pytest.mark.asyncio
+    async def test_cached_sections_excluded_from_next_request(self, proofreader, ai_service):
+        """キャッシュ済みのセクションは次回のリクエストに含めない"""
+        await proofreader._ai_batch_proofread({
+            ApplicationSection.COMPANY_OVERVIEW: OVERVIEW_TEXT,
+        })
+
+        results = await proofreader._ai_batch_proofread({
+            ApplicationSection.COMPANY_OVERVIEW: OVERVIEW_TEXT,
+            ApplicationSection.PROJECT_SUMMARY: SUMMARY_TEXT,
+        })
+
+        assert ai_service.generate_text.await_count == 2
+        second_prompt = ai_service.generate_text.await_args.kwargs["prompt"]
+        assert ApplicationSection.PROJECT_SUMMARY.value in second_prompt
+        assert OVERVIEW_TEXT not in second_prompt
+        assert set(results) == {ApplicationSection.COMPANY_OVERVIEW, ApplicationSection.PROJECT_SUMMARY}
+
+    @pytest.mark.asyncio
+    async def test_mutating_returned_issues_does_not_change_cache(self, proofreader, ai_service):
+        ai_service.generate_text.return_value = make_ai_response(batch_payload({
+            ApplicationSection.COMPANY_OVERVIEW: [
+                {"type": "grammar", "severity": "high", "original": "IT企業", "suggested": "IT関連企業"}
+            ],
+        }))
+        sections = {ApplicationSection.COMPANY_OVERVIEW: OVERVIEW_TEXT}
+
+        first = await proofreader._ai_batch_proofread(sections)
+        first[ApplicationSection.COMPANY_OVERVIEW][0].suggested_text = "呼び出し側で変更"
+        first[ApplicationSection.COMPANY_OVERVIEW].clear()
+
+        second = await proofreader._ai_batch_proofread(sections)
+
+        assert ai_service.generate_text.await_count == 1
+        assert [i.suggested_text for i in second[ApplicationSection.COMPANY_OVERVIEW]] == ["IT関連企業"]
+
+    @pytest.mark.asyncio
+    async def test_batch_and_single_results_cached_separately(self, proofreader, ai_service):
+        """一括校正（文法観点を含む）と単体校正の結果は別々にキャッシュする"""
+        ai_service.generate_text.return_value = make_ai_response(batch_payload({
+            ApplicationSection.COMPANY_OVERVIEW: [
+                {"type": "grammar", "severity": "high", "original": "IT企業", "suggested": "IT関連企業"}
+            ],
+        }))
+        await proofreader._ai_batch_proofread({ApplicationSection.COMPANY_OVERVIEW: OVERVIEW_TEXT})
+
+        ai_service.generate_text.return_value = make_ai_response({"issues": []})
+        single_issues = await proofreader._ai_based_proofreading(
+            OVERVIEW_TEXT, ApplicationSection.COMPANY_OVERVIEW
+        )
+
+        assert ai_service.generate_text.await_count == 2
+        assert single_issues == []
+
+        batch_issues = await proofreader._ai_batch_proofread(
+            {ApplicationSection.COMPANY_OVERVIEW: OVERVIEW_TEXT}
+        )
+        assert ai_service.generate_text.await_count == 2
+        assert [i.original_text for i in batch_issues[ApplicationSection.COMPANY_OVERVIEW]] == ["IT企業"]
+
+
+class TestImproveReadabilityBatch:
+    """可読性一括向上テスト"""
+
+    @pytest.mark.asyncio
+    async def test_results_returned_in_input_order(self, proofreader, ai_service):
+        """テキストごとに改善版を生成し、入力順で返す"""
+        texts = [OVERVIEW_TEXT, SUMMARY_TEXT]
+
+        async def improve(prompt, provider, options):
+            original = next(text for text in texts if text in prompt)
+            return Mock(success=True, content=f"改善:{original}")
+
+        ai_service.generate_text.side_effect = improve
+
+        results = await proofreader.improve_readability_batch(texts)
+
+        assert ai_service.generate_text.await_count == len(texts)
+        assert [r["original_text"] for r in results] == texts
+        assert [r["improved_text"] for r in results] == [f"改善:{text}" for text in texts]
+        assert all("improvement_score" in r for r in results)
+
+    @pytest.mark.asyncio
+    async def test_failed_generation_keeps_original_text(self, proofreader, ai_service):
+        ai_service.generate_text.return_value = Mock(success=False, content=None)
+
+        results = await proofreader.improve_readability_batch([OVERVIEW_TEXT])
+
+        assert results[0]["improved_text"] == OVERVIEW_TEXT
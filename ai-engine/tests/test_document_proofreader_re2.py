@@ -0,0 +1,65 @@
+"""
+文書校正サービス RE2スキャンパターンテスト
+RE2（google-re2）導入時の明瞭性・敬語チェックが標準 re と同じ結果になることを確認
+"""
+
+import re
+from dataclasses import asdict
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("re2")
+
+from src.services import document_proofreader
+from src.services.application_writer import ApplicationSection
+from src.services.document_proofreader import DocumentProofreader, StyleGuide
+from src.services.enhanced_ai_service import EnhancedAIService
+
+
+CLARITY_TEXT = (
+    "本事業は当社により実施される。設備は専門業者に導入される予定であり、"
+    "運用は社員に任せられる。" + "生産工程の自動化によって作業時間を大幅に短縮し、" * 4
+    + "品質の安定化も図られる！今後の展開は検討される？"
+)
+FORMAL_TEXT = "当社は新製品を開発します。販路開拓を行います。十分な効果があると考えております。市場は拡大すると思います。"
+
+RE2_PATTERN_NAMES = ("_CLARITY_RE", "_FORMAL_RE", "_HONORIFIC_CONTEXT_RE")
+
+
+@pytest.fixture
+def proofreader():
+    return DocumentProofreader(Mock(spec=EnhancedAIService))
+
+
+def issue_fields(issues):
+    return [asdict(issue) for issue in issues]
+
+
+def run_scans(proofreader):
+    clarity = proofreader._check_clarity(CLARITY_TEXT, ApplicationSection.PROJECT_SUMMARY)
+    formal = proofreader._check_formal_language(FORMAL_TEXT, StyleGuide())
+    return issue_fields(clarity), issue_fields(formal)
+
+
+class TestRE2ScanPatterns:
+    """RE2スキャンパターンテスト"""
+
+    def test_scan_patterns_compiled_with_re2(self):
+        for name in RE2_PATTERN_NAMES:
+            assert not isinstance(getattr(document_proofreader, name), re.Pattern), name
+
+    def test_clarity_and_honorific_scans_match_standard_re(self, proofreader, monkeypatch):
+        """名前付きグループ（lastgroup）や位置情報を含め、標準 re と同じ指摘を返す"""
+        re2_clarity, re2_formal = run_scans(proofreader)
+
+        for name in RE2_PATTERN_NAMES:
+            monkeypatch.setattr(
+                document_proofreader, name,
+                re.compile(getattr(document_proofreader, name).pattern)
+            )
+        re_clarity, re_formal = run_scans(proofreader)
+
+        assert re2_clarity and re2_formal
+        assert re2_clarity == re_clarity
+        assert re2_formal == re_formal
@@ -0,0 +1,493 @@
+"""
+強化AI統合サービス 汎用テキスト生成・ハイブリッド生成・一括予測・JSON抽出・応答キャッシュ・同時実行集約・プロンプトJSONテスト
+プロバイダー呼び出しはスタブに差し替えて実行（外部API通信なし）
+"""
+
+import pytest
+import asyncio
+import json
+from datetime import datetime, date
+from unittest.mock import Mock, AsyncMock
+
+from src.services import enhanced_ai_service
+from src.services.enhanced_ai_service import EnhancedAIService, AIProvider, _dumps_for_prompt
+
+
+def make_anthropic_response(text: str, input_tokens: int = 1000, output_tokens: int = 500):
+    """Anthropic API 応答のスタブ"""
+    response = Mock()
+    response.content = [Mock(text=text)]
+    response.model = "claude-3-5-sonnet"
+    response.usage = Mock(input_tokens=input_tokens, output_tokens=output_tokens)
+    response.stop_reason = "end_turn"
+    return response
+
+
+def make_openai_response(text: str):
+    """OpenAI API 応答のスタブ"""
+    response = Mock()
+    response.choices = [Mock()]
+    response.choices[0].message.content = text
+    response.choices[0].finish_reason = "stop"
+    response.model = "gpt-4"
+    response.usage = Mock(prompt_tokens=100, completion_tokens=200)
+    response.usage.model_dump = lambda: {"prompt_tokens": 100, "completion_tokens": 200}
+    return response
+
+
+@pytest.fixture
+def ai_service(monkeypatch):
+    """プロバイダー呼び出しをスタブ化したAIサービス"""
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+    monkeypatch.setenv('ANTHROPIC_API_KEY', 'test-key')
+    service = EnhancedAIService()
+    service._make_anthropic_call = AsyncMock(return_value=make_anthropic_response("生成結果"))
+    service._make_openai_call = AsyncMock(return_value=make_openai_response("生成結果"))
+    return service
+
+
+class TestGenerateText:
+    """汎用テキスト生成テスト"""
+
+    @pytest.mark.asyncio
+    async def test_temperature_option_passed_to_provider(self, ai_service):
+        response = await ai_service.generate_text(
+            prompt="プロンプト", provider=AIProvider.ANTHROPIC, options={"temperature": 0.2}
+        )
+
+        assert response.success
+        assert response.content == "生成結果"
+        assert ai_service._make_anthropic_call.await_args.kwargs["temperature"] == 0.2
+
+    @pytest.mark.asyncio
+    async def test_results_cached_per_temperature(self, ai_service):
+        await ai_service.generate_text("プロンプト", AIProvider.ANTHROPIC, {"temperature": 0.2})
+        cached = await ai_service.generate_text("プロンプト", AIProvider.ANTHROPIC, {"temperature": 0.2})
+        await ai_service.generate_text("プロンプト", AIProvider.ANTHROPIC, {"temperature": 0.7})
+
+        assert cached.metadata["cached"] is True
+        assert ai_service._make_anthropic_call.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_provider_failure_returned_as_failed_response(self, ai_service):
+        ai_service._make_openai_call.side_effect = RuntimeError("boom")
+
+        response = await ai_service.generate_text("プロンプト", AIProvider.OPENAI)
+
+        assert not response.success
+        assert "boom" in response.error
+
+
+class TestHybridGeneration:
+    """ハイブリッド生成（複数プロバイダー並列実行）テスト"""
+
+    @pytest.fixture
+    def business_plan_service(self, ai_service):
+        """品質評価・メトリクス記録をスタブ化したAIサービス"""
+        ai_service.quality_evaluator = Mock(evaluate_business_plan=AsyncMock(return_value=80))
+        ai_service.metrics_collector = Mock(record_request=AsyncMock())
+        return ai_service
+
+    @pytest.mark.asyncio
+    async def test_fast_failure_then_slow_success_returns_success(self, ai_service):
+        """先に失敗したプロバイダーは無視し、後から成功した応答を採用する"""
+        async def slow_anthropic(prompt, **options):
+            await asyncio.sleep(0.01)
+            return make_anthropic_response("Anthropicの生成結果")
+
+        ai_service._make_openai_call.side_effect = RuntimeError("boom")
+        ai_service._make_anthropic_call.side_effect = slow_anthropic
+
+        response = await ai_service._hybrid_generation("プロンプト", Mock(options=None))
+
+        assert response.success
+        assert response.content == "Anthropicの生成結果"
+        assert response.metadata["providers_used"] == ["anthropic"]
+
+    @pytest.mark.asyncio
+    async def test_losing_request_is_cancelled(self, ai_service):
+        cancelled = asyncio.Event()
+
+        async def hanging_anthropic(prompt, **options):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        ai_service._make_anthropic_call.side_effect = hanging_anthropic
+
+        response = await ai_service._hybrid_generation("プロンプト", Mock(options=None))
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+        assert response.success
+        assert response.provider == "openai"
+        assert response.metadata["providers_used"] == ["openai"]
+
+    @pytest.mark.asyncio
+    async def test_every_provider_failing_returns_failure(self, ai_service):
+        ai_service._make_openai_call.side_effect = RuntimeError("boom")
+        ai_service._make_anthropic_call.side_effect = RuntimeError("boom")
+
+        response = await ai_service._hybrid_generation("プロンプト", Mock(options=None))
+
+        assert not response.success
+        assert response.error == "全てのAIプロバイダーが失敗しました"
+        assert response.metadata["providers_used"] == []
+
+    @pytest.mark.asyncio
+    async def test_quality_gate_compares_every_provider(self, business_plan_service):
+        business_plan_service._make_anthropic_call.return_value = make_anthropic_response(
+            "より詳しいAnthropicの生成結果"
+        )
+
+        response = await business_plan_service.generate_business_plan(
+            {"name": "テスト株式会社"}, "ものづくり補助金", [], quality_gate=True
+        )
+
+        assert business_plan_service._make_openai_call.await_count == 1
+        assert business_plan_service._make_anthropic_call.await_count == 1
+        assert response.content == "より詳しいAnthropicの生成結果"
+        assert response.metadata["providers_used"] == ["openai", "anthropic"]
+
+    @pytest.mark.asyncio
+    async def test_quality_gate_not_served_from_first_to_finish_cache(self, business_plan_service):
+        """最初の成功で得たキャッシュは全応答比較のリクエストに使わない"""
+        company_data = {"name": "テスト株式会社"}
+        await business_plan_service.generate_business_plan(company_data, "ものづくり補助金", [])
+        openai_calls = business_plan_service._make_openai_call.await_count
+
+        response = await business_plan_service.generate_business_plan(
+            company_data, "ものづくり補助金", [], quality_gate=True
+        )
+
+        assert business_plan_service._make_openai_call.await_count == openai_calls + 1
+        assert "cached" not in response.metadata
+
+
+class TestAdoptionPredictionBatch:
+    """採択可能性一括予測テスト"""
+
+    @pytest.fixture
+    def applications(self):
+        return [{"title": f"申請{index}"} for index in range(3)]
+
+    @pytest.fixture
+    def subsidy_program(self):
+        return {"name": "ものづくり補助金"}
+
+    @pytest.mark.asyncio
+    async def test_results_mapped_by_id_and_missing_id_predicted_individually(
+        self, ai_service, applications, subsidy_program
+    ):
+        """応答の順序に関係なくidで対応付け、idが欠けた申請は単体予測で再実行する"""
+        batch_content = json.dumps([
+            {"id": 2, "adoption_probability": 0.2},
+            {"id": 0, "adoption_probability": 0.9},
+        ])
+        single_content = json.dumps({"adoption_probability": 0.5, "confidence_score": 0.8})
+        ai_service._make_anthropic_call.side_effect = [
+            make_anthropic_response(batch_content),
+            make_anthropic_response(single_content),
+        ]
+
+        results = await ai_service.predict_adoption_probability_batch(applications, subsidy_program)
+
+        assert ai_service._make_anthropic_call.await_count == 2
+        single_prompt = ai_service._make_anthropic_call.await_args_list[1].args[0]
+        assert "申請1" in single_prompt and "申請0" not in single_prompt
+        assert [r.success for r in results] == [True, True, True]
+        predictions = [json.loads(r.content) for r in results]
+        assert [p["adoption_probability"] for p in predictions] == [0.9, 0.5, 0.2]
+        assert "batch_size" not in results[1].metadata
+        # 再予測分には一括呼び出しの按分コストと再予測のコストを計上する
+        call_cost = ai_service._calculate_anthropic_cost(make_anthropic_response("").usage)
+        assert results[0].cost == pytest.approx(call_cost / 3)
+        assert results[1].cost == pytest.approx(call_cost / 3 + call_cost)
+
+    @pytest.mark.asyncio
+    async def test_unparseable_response_predicts_every_application_individually(
+        self, ai_service, applications, subsidy_program
+    ):
+        """一括応答をパースできない場合は全申請を単体予測で再実行する"""
+        single_content = json.dumps({"adoption_probability": 0.5})
+        ai_service._make_anthropic_call.side_effect = [
+            make_anthropic_response("JSONではない応答"),
+        ] + [make_anthropic_response(single_content)] * 3
+
+        results = await ai_service.predict_adoption_probability_batch(applications, subsidy_program)
+
+        assert ai_service._make_anthropic_call.await_count == 4
+        assert all(r.success for r in results)
+        assert [json.loads(r.content)["adoption_probability"] for r in results] == [0.5] * 3
+
+    @pytest.mark.asyncio
+    async def test_failed_individual_prediction_is_not_reported_as_success(
+        self, ai_service, applications, subsidy_program
+    ):
+        """再予測でもパースできない場合は既定値を成功扱いにしない"""
+        ai_service._make_anthropic_call.return_value = make_anthropic_response("JSONではない応答")
+
+        results = await ai_service.predict_adoption_probability_batch(applications, subsidy_program)
+
+        assert all(not r.success and r.error for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cost_split_evenly_across_applications(
+        self, ai_service, applications, subsidy_program
+    ):
+        """1回の呼び出しコストを申請数で均等に按分する"""
+        content = json.dumps([{"id": index} for index in range(3)])
+        provider_response = make_anthropic_response(content, input_tokens=3000, output_tokens=1500)
+        ai_service._make_anthropic_call.return_value = provider_response
+        total_cost = ai_service._calculate_anthropic_cost(provider_response.usage)
+
+        results = await ai_service.predict_adoption_probability_batch(applications, subsidy_program)
+
+        assert ai_service._make_anthropic_call.await_count == 1
+        assert [r.cost for r in results] == pytest.approx([total_cost / 3] * 3)
+        assert sum(r.cost for r in results) == pytest.approx(total_cost)
+        assert all(r.metadata["batch_size"] == 3 for r in results)
+
+    @pytest.mark.asyncio
+    async def test_output_token_limit_scaled_with_batch_size(self, ai_service, subsidy_program):
+        """出力トークン上限は申請数に比例させ、モデルの出力上限で頭打ちにする"""
+        ai_service._make_anthropic_call.return_value = make_anthropic_response(
+            json.dumps([{"id": index} for index in range(5)])
+        )
+
+        await ai_service.predict_adoption_probability_batch(
+            [{"title": "申請0"}, {"title": "申請1"}], subsidy_program
+        )
+        assert ai_service._make_anthropic_call.await_args.kwargs["max_tokens"] == 3000
+
+        await ai_service.predict_adoption_probability_batch(
+            [{"title": f"申請{index}"} for index in range(5)], subsidy_program
+        )
+        assert ai_service._make_anthropic_call.await_args.kwargs["max_tokens"] == 7500
+
+    @pytest.mark.asyncio
+    async def test_request_timeout_scaled_with_batch_size(self, ai_service, subsidy_program):
+        """タイムアウトは申請数に比例させてSDK呼び出しに渡す"""
+        ai_service._make_anthropic_call.return_value = make_anthropic_response(
+            json.dumps([{"id": index} for index in range(3)])
+        )
+
+        await ai_service.predict_adoption_probability_batch(
+            [{"title": f"申請{index}"} for index in range(3)], subsidy_program
+        )
+
+        timeout = ai_service.provider_config[AIProvider.ANTHROPIC]["timeout"]
+        assert ai_service._make_anthropic_call.await_args.kwargs["timeout"] == timeout * 3
+
+    @pytest.mark.asyncio
+    async def test_large_input_split_into_batches_in_order(self, ai_service, subsidy_program):
+        """バッチサイズを超える入力は複数回の呼び出しに分割し、入力順で返す"""
+        applications = [{"title": f"申請{index}"} for index in range(7)]
+
+        async def respond(prompt, **options):
+            count = prompt.count("### 申請 ")
+            return make_anthropic_response(json.dumps([
+                {"id": index, "batch_count": count, "position": index} for index in range(count)
+            ]))
+
+        ai_service._make_anthropic_call.side_effect = respond
+
+        results = await ai_service.predict_adoption_probability_batch(applications, subsidy_program)
+
+        assert ai_service._make_anthropic_call.await_count == 2
+        predictions = [json.loads(r.content) for r in results]
+        assert [p["batch_count"] for p in predictions] == [5] * 5 + [2] * 2
+        assert [p["position"] for p in predictions] == [0, 1, 2, 3, 4, 0, 1]
+
+    @pytest.mark.asyncio
+    async def test_provider_failure_marks_every_application_failed(
+        self, ai_service, applications, subsidy_program
+    ):
+        """呼び出し失敗時は申請ごとに失敗応答を返す"""
+        ai_service._make_anthropic_call.side_effect = RuntimeError("boom")
+
+        results = await ai_service.predict_adoption_probability_batch(applications, subsidy_program)
+
+        assert len(results) == 3
+        assert all(not r.success and "boom" in r.error for r in results)
+
+    def test_batch_prediction_result_leaves_missing_ids_empty(self, ai_service):
+        content = json.dumps([{"id": 1, "adoption_probability": 0.6}, "不正な要素"])
+
+        results = ai_service._parse_batch_prediction_result(content, 2)
+
+        assert results[0] is None
+        assert results[1]["adoption_probability"] == 0.6
+        assert ai_service._parse_batch_prediction_result("JSONではない応答", 2) == [None, None]
+
+
+class TestJsonContentParsing:
+    """AI応答のJSON抽出テスト"""
+
+    @pytest.mark.parametrize("content", [
+        '{"score": 80}',
+        '```json\n{"score": 80}\n```',
+        '```\n{"score": 80}\n```',
+        '分析結果は以下の通りです。\n{"score": 80}\n以上です。',
+        '結果:\n```json\n{"score": 80}\n```\n補足: 特になし',
+    ])
+    def test_object_extracted_from_fenced_or_prose_wrapped_content(self, ai_service, content):
+        assert ai_service._parse_json_content(content) == {"score": 80}
+
+    def test_array_extracted_from_prose_wrapped_content(self, ai_service):
+        content = '各申請の結果です。\n[{"id": 0}, {"id": 1}]\nご確認ください。'
+        assert ai_service._parse_json_content(content) == [{"id": 0}, {"id": 1}]
+
+    @pytest.mark.parametrize("content", [None, "", "JSONではない応答", "{壊れた: JSON"])
+    def test_unparseable_content_returns_none(self, ai_service, content):
+        assert ai_service._parse_json_content(content) is None
+
+    def test_batch_prediction_result_from_fenced_array(self, ai_service):
+        content = '```json\n[{"id": 1, "adoption_probability": 0.6}]\n```'
+
+        results = ai_service._parse_batch_prediction_result(content, 2)
+
+        assert results[0] is None
+        assert results[1]["adoption_probability"] == 0.6
+
+
+class TestResponseCache:
+    """生成結果キャッシュテスト"""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_provider_and_reports_no_cost(self, ai_service):
+        first = await ai_service._generate_with_cache("プロンプト", None, AIProvider.ANTHROPIC)
+        second = await ai_service._generate_with_cache("プロンプト", None, AIProvider.ANTHROPIC)
+
+        assert ai_service._make_anthropic_call.await_count == 1
+        assert first.cost > 0
+        assert "cached" not in first.metadata
+        assert second.content == first.content
+        assert second.cost == 0.0
+        assert second.metadata["usage"] == {}
+        assert second.metadata["cached"] is True
+
+    @pytest.mark.asyncio
+    async def test_mutating_returned_response_does_not_change_cache(self, ai_service):
+        first = await ai_service._generate_with_cache("プロンプト", None, AIProvider.ANTHROPIC)
+        first.content = "呼び出し側で変更"
+        first.metadata["usage"]["input_tokens"] = 0
+
+        second = await ai_service._generate_with_cache("プロンプト", None, AIProvider.ANTHROPIC)
+        second.content = "再度変更"
+
+        third = await ai_service._generate_with_cache("プロンプト", None, AIProvider.ANTHROPIC)
+        assert third.content == "生成結果"
+        cached = next(iter(ai_service.response_cache.values()))
+        assert cached.metadata["usage"]["input_tokens"] == 1000
+
+    @pytest.mark.asyncio
+    async def test_cache_entries_isolated_by_prompt_and_provider(self, ai_service):
+        await ai_service._generate_with_cache("プロンプトA", None, AIProvider.ANTHROPIC)
+        await ai_service._generate_with_cache("プロンプトB", None, AIProvider.ANTHROPIC)
+        await ai_service._generate_with_cache("プロンプトA", None, AIProvider.OPENAI)
+
+        assert ai_service._make_anthropic_call.await_count == 2
+        assert ai_service._make_openai_call.await_count == 1
+        assert len(ai_service.response_cache) == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_generation_is_not_cached(self, ai_service):
+        ai_service._make_anthropic_call.side_effect = [
+            RuntimeError("boom"),
+            make_anthropic_response("生成結果"),
+        ]
+
+        with pytest.raises(Exception):
+            await ai_service._generate_with_cache("プロンプト", None, AIProvider.ANTHROPIC)
+        assert len(ai_service.response_cache) == 0
+
+        response = await ai_service._generate_with_cache("プロンプト", None, AIProvider.ANTHROPIC)
+        assert response.success
+        assert ai_service._make_anthropic_call.await_count == 2
+
+
+class TestInflightCoalescing:
+    """同一内容の同時リクエスト集約テスト"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_prompts_make_one_provider_call(self, ai_service):
+        release = asyncio.Event()
+
+        async def slow_call(prompt, **options):
+            await release.wait()
+            return make_anthropic_response("生成結果")
+
+        ai_service._make_anthropic_call.side_effect = slow_call
+
+        waiters = [
+            asyncio.create_task(
+                ai_service._generate_with_cache("プロンプト", None, AIProvider.ANTHROPIC)
+            )
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        responses = await asyncio.gather(*waiters)
+
+        assert ai_service._make_anthropic_call.await_count == 1
+        assert all(r.content == "生成結果" for r in responses)
+        assert len({id(r) for r in responses}) == 5
+        # 呼び出しコストは生成を開始した1件のみに計上する
+        assert sum(1 for r in responses if r.cost > 0) == 1
+        assert sum(1 for r in responses if r.metadata.get("cached")) == 4
+        assert ai_service.inflight_generations == {}
+
+    @pytest.mark.asyncio
+    async def test_different_prompts_are_not_coalesced(self, ai_service):
+        await asyncio.gather(
+            ai_service._generate_with_cache("プロンプトA", None, AIProvider.ANTHROPIC),
+            ai_service._generate_with_cache("プロンプトB", None, AIProvider.ANTHROPIC),
+        )
+
+        assert ai_service._make_anthropic_call.await_count == 2
+
+
+class TestPromptJson:
+    """プロンプト埋め込み用JSONテスト"""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_dates_and_nan_serialized_same_with_or_without_orjson(self, monkeypatch, use_orjson):
+        """orjsonの有無にかかわらず日時はISO形式、NaNはnullとして出力する"""
+        if use_orjson and not enhanced_ai_service.ORJSON_AVAILABLE:
+            pytest.skip("orjson未導入")
+        monkeypatch.setattr(enhanced_ai_service, "ORJSON_AVAILABLE", use_orjson)
+        data = {
+            "submitted_at": datetime(2024, 1, 2, 3, 4, 5),
+            "deadline": date(2024, 3, 31),
+            "score": float("nan"),
+            "history": [{"year": 2023, "amount": float("inf")}],
+            1: "数値キー",
+        }
+
+        assert json.loads(_dumps_for_prompt(data)) == {
+            "submitted_at": "2024-01-02T03:04:05",
+            "deadline": "2024-03-31",
+            "score": None,
+            "history": [{"year": 2023, "amount": None}],
+            "1": "数値キー",
+        }
+
+    @pytest.mark.parametrize("data", [
+        {"business_plan": "事業計画" * 10000},
+        {"history": [{"year": 2000 + i, "note": "実績" * 50} for i in range(500)]},
+        {f"item_{i}": "値" * 100 for i in range(1000)},
+    ])
+    def test_oversized_data_shortened_to_valid_json(self, data):
+        """上限を超えるデータは縮約し、上限内の妥当なJSONとして返す"""
+        text = _dumps_for_prompt(data)
+
+        assert len(text) <= enhanced_ai_service.PROMPT_DATA_MAX_CHARS
+        assert isinstance(json.loads(text), dict)
+        assert "省略" in text
+
+    def test_data_within_limit_not_shortened(self):
+        data = {"company_name": "テスト株式会社", "history": list(range(100))}
+
+        assert json.loads(_dumps_for_prompt(data)) == data
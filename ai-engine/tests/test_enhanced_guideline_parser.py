@@ -0,0 +1,39 @@
+"""
+強化された募集要項解析サービス リスト項目抽出テスト
+"""
+
+import re
+
+import pytest
+
+from src.services.enhanced_guideline_parser import EnhancedGuidelineParser
+
+
+@pytest.fixture
+def parser():
+    return EnhancedGuidelineParser()
+
+
+def parse_list(parser, body: str):
+    """見出し「対象経費」直後からのリスト項目を抽出"""
+    full_text = "【対象経費】\n" + body
+    match = re.search(r"【対象経費】", full_text)
+    return parser._parse_list_from_match(match, full_text)
+
+
+class TestListItemExtraction:
+    """リスト項目抽出テスト"""
+
+    def test_mixed_markers_returned_in_document_order(self, parser):
+        body = "1) 機械装置費\n・外注費\n- 旅費\n2) 委託費"
+
+        assert parse_list(parser, body) == ["機械装置費", "外注費", "旅費", "委託費"]
+
+    @pytest.mark.parametrize("body", [
+        "1\n・機械装置費",
+        "1\n\n・機械装置費",
+        "12 \n・機械装置費",
+    ])
+    def test_bare_number_line_does_not_absorb_next_item(self, parser, body):
+        """ページ番号などの数字だけの行は次の行の項目を取り込まない"""
+        assert parse_list(parser, body) == ["機械装置費"]